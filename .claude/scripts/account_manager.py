@@ -23,50 +23,291 @@ Usage:
   python account_manager.py export [--format csv|json] [--output <file>]
   python account_manager.py interaction <id> --type <type> --note "text"
 
-Data stored in: output/accounts/
+Data stored in: output/accounts/ (contacts in contacts.db, follow-ups in followups.json)
 """
 
 import argparse
+import bisect
 import csv
-import json
 import os
+import sqlite3
 import sys
 import uuid
+from collections import Counter, defaultdict
 from datetime import datetime, date
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import orjson
 
 DATA_DIR = Path("output/accounts")
 CONTACTS_FILE = DATA_DIR / "contacts.json"
+CONTACTS_DB = DATA_DIR / "contacts.db"
 FOLLOWUPS_FILE = DATA_DIR / "followups.json"
 
 DEAL_STAGES = ["lead", "qualified", "proposal", "negotiation", "closed_won", "closed_lost"]
+SEARCH_LIMIT = 200
+SEARCH_FIELDS = ("name", "company", "email", "role", "tags")
+
+_DUMP_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+# Parsed file contents keyed by path, invalidated when (mtime, size) changes on disk
+_CACHE: Dict[Path, Tuple[Tuple[int, int], list]] = {}
 
 
 def _ensure_dirs():
     DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def _stat_key(filepath: Path) -> Tuple[int, int]:
+    st = filepath.stat()
+    return st.st_mtime_ns, st.st_size
+
+
 def _load(filepath: Path) -> list:
-    if filepath.exists():
-        return json.loads(filepath.read_text())
-    return []
+    if not filepath.exists():
+        _CACHE.pop(filepath, None)
+        return []
+    key = _stat_key(filepath)
+    cached = _CACHE.get(filepath)
+    if cached and cached[0] == key:
+        return cached[1]
+    data = orjson.loads(filepath.read_bytes())
+    _CACHE[filepath] = (key, data)
+    return data
 
 
 def _save(filepath: Path, data: list):
     _ensure_dirs()
-    filepath.write_text(json.dumps(data, indent=2, default=str))
+    filepath.write_bytes(orjson.dumps(data, option=_DUMP_OPTS))
+    _CACHE[filepath] = (_stat_key(filepath), data)
+
+
+def _write_json(out, data):
+    """Write indented JSON to a binary stream; lists and iterators are serialized one element at a time."""
+    if isinstance(data, (list, Iterator)):
+        out.write(b"[")
+        i = -1
+        for i, item in enumerate(data):
+            out.write(b",\n" if i else b"\n")
+            out.write(orjson.dumps(item, option=_DUMP_OPTS))
+        out.write(b"\n]\n" if i >= 0 else b"]\n")
+    else:
+        out.write(orjson.dumps(data, option=_DUMP_OPTS | orjson.OPT_APPEND_NEWLINE))
+
+
+def _emit(data):
+    """Print ``data`` as JSON straight to stdout's byte buffer."""
+    sys.stdout.flush()
+    _write_json(sys.stdout.buffer, data)
+    sys.stdout.buffer.flush()
 
 
 def _gen_id() -> str:
     return str(uuid.uuid4())[:8]
 
 
+# ─── Storage ─────────────────────────────────────────────────────────────────
+
+class ContactStore:
+    """SQLite-backed contact store: one row per contact, full record in a JSON column.
+
+    Mutations touch a single row instead of rewriting the whole contact list.
+    deal_stage and source are indexed via expression indexes on the JSON.
+    Searchable fields are mirrored into an FTS5 table by triggers when the
+    SQLite build supports it, and kept pre-lowercased in a ``search`` column
+    for substring matching.
+    An existing contacts.json is imported once; ``PRAGMA user_version`` records that
+    the import committed, so a failed import is retried on the next run.
+    """
+
+    def __init__(self, db_path: Path = CONTACTS_DB, legacy_file: Path = CONTACTS_FILE):
+        _ensure_dirs()
+        self._db = sqlite3.connect(db_path)
+        self._db.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA recursive_triggers=ON;  -- INSERT OR REPLACE then fires contacts_fts_del
+            CREATE TABLE IF NOT EXISTS contacts (
+                id TEXT PRIMARY KEY, data TEXT NOT NULL, search TEXT NOT NULL DEFAULT ''
+            );
+            CREATE INDEX IF NOT EXISTS contacts_stage ON contacts (json_extract(data, '$.deal_stage'));
+            CREATE INDEX IF NOT EXISTS contacts_source ON contacts (json_extract(data, '$.source'));
+        """)
+        self.fts = self._init_fts()
+        if self._db.execute("PRAGMA user_version").fetchone()[0] < 1:
+            self._import_legacy(legacy_file)
+
+    def _import_legacy(self, legacy_file: Path):
+        """Copy contacts.json into the table and mark the schema migrated in the same transaction."""
+        records = orjson.loads(legacy_file.read_bytes()) if legacy_file.exists() else []
+        for r in records:
+            if not r.get("id"):
+                r["id"] = _gen_id()
+        with self._db:
+            self._db.executemany(
+                "INSERT OR IGNORE INTO contacts (id, data, search) VALUES (?, ?, ?)",
+                ((r["id"], orjson.dumps(r).decode(), _search_text(r)) for r in records),
+            )
+            self._db.execute("PRAGMA user_version = 1")
+
+    def _init_fts(self) -> bool:
+        """Create the full-text mirror of name/company/email/role/tags; False if FTS5 is missing.
+
+        FTS rows share the contact's rowid, so the triggers maintain them by rowid
+        lookup rather than scanning the FTS table.
+        """
+        exists = self._db.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'contacts_fts'"
+        ).fetchone()
+        if exists:
+            return True
+        fields = ("json_extract(new.data, '$.name'), json_extract(new.data, '$.company'), "
+                  "json_extract(new.data, '$.email'), json_extract(new.data, '$.role'), "
+                  "(SELECT group_concat(value, ' ') FROM json_each(new.data, '$.tags'))")
+        try:
+            with self._db:
+                self._db.executescript(f"""
+                    CREATE VIRTUAL TABLE contacts_fts USING fts5(
+                        name, company, email, role, tags,
+                        tokenize='unicode61 remove_diacritics 2'
+                    );
+                    CREATE TRIGGER contacts_fts_ins AFTER INSERT ON contacts BEGIN
+                        INSERT INTO contacts_fts (rowid, name, company, email, role, tags)
+                        VALUES (new.rowid, {fields});
+                    END;
+                    CREATE TRIGGER contacts_fts_upd AFTER UPDATE OF data ON contacts BEGIN
+                        DELETE FROM contacts_fts WHERE rowid = old.rowid;
+                        INSERT INTO contacts_fts (rowid, name, company, email, role, tags)
+                        VALUES (new.rowid, {fields});
+                    END;
+                    CREATE TRIGGER contacts_fts_del AFTER DELETE ON contacts BEGIN
+                        DELETE FROM contacts_fts WHERE rowid = old.rowid;
+                    END;
+                """)
+                self._db.execute(
+                    "INSERT INTO contacts_fts (rowid, name, company, email, role, tags) SELECT rowid, "
+                    + fields.replace("new.data", "data") + " FROM contacts"
+                )
+        except sqlite3.OperationalError:
+            return False
+        return True
+
+    def _rows(self, sql: str, params: tuple = ()) -> List[Dict]:
+        return [orjson.loads(row[0]) for row in self._db.execute(sql, params)]
+
+    def append(self, record: Dict):
+        self.append_many([record])
+
+    def append_many(self, records: List[Dict]):
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO contacts (id, data, search) VALUES (?, ?, ?)",
+                ((r["id"], orjson.dumps(r).decode(), _search_text(r)) for r in records),
+            )
+
+    def update(self, contact_id: str, patch: Dict) -> Optional[Dict]:
+        """Merge ``patch`` into the stored record (RFC 7396) and return the result."""
+        with self._db:
+            cur = self._db.execute(
+                "UPDATE contacts SET data = json_patch(data, ?) WHERE id = ?",
+                (orjson.dumps(patch).decode(), contact_id),
+            )
+            if cur.rowcount == 0:
+                return None
+            record = self.get(contact_id)
+            if not patch.keys().isdisjoint(SEARCH_FIELDS):
+                self._db.execute("UPDATE contacts SET search = ? WHERE id = ?", (_search_text(record), contact_id))
+        return record
+
+    def get(self, contact_id: str) -> Optional[Dict]:
+        rows = self._rows("SELECT data FROM contacts WHERE id = ?", (contact_id,))
+        return rows[0] if rows else None
+
+    def all(self) -> List[Dict]:
+        return list(self.iter_all())
+
+    def iter_all(self) -> Iterator[Dict]:
+        """Yield every contact in insertion order, decoding rows as the cursor reaches them."""
+        for (data,) in self._db.execute("SELECT data FROM contacts ORDER BY rowid"):
+            yield orjson.loads(data)
+
+    def filter(self, stage: str = None, tag: str = None, source: str = None) -> List[Dict]:
+        clauses, params = [], []
+        if stage:
+            clauses.append("json_extract(data, '$.deal_stage') = ?")
+            params.append(stage)
+        if source:
+            clauses.append("json_extract(data, '$.source') = ?")
+            params.append(source)
+        if tag:
+            clauses.append("EXISTS (SELECT 1 FROM json_each(data, '$.tags') WHERE value = ?)")
+            params.append(tag)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._rows(f"SELECT data FROM contacts{where} ORDER BY rowid", tuple(params))
+
+    def search(self, query: str, limit: int = SEARCH_LIMIT) -> List[Dict]:
+        """Prefix-match every whitespace-separated term of ``query``, best matches first."""
+        terms = ['"' + t.replace('"', '""') + '"*' for t in query.split()]
+        if not terms:
+            return []
+        return self._rows(
+            "SELECT c.data FROM contacts_fts f JOIN contacts c ON c.rowid = f.rowid "
+            "WHERE contacts_fts MATCH ? ORDER BY f.rank LIMIT ?",
+            (" ".join(terms), limit),
+        )
+
+    def substring_search(self, query: str) -> List[Dict]:
+        """Case-insensitive substring match against the precomputed ``search`` column."""
+        return self._rows(
+            "SELECT data FROM contacts WHERE instr(search, ?) > 0 ORDER BY rowid", (query.lower(),)
+        )
+
+    def stage_counts(self) -> Counter:
+        """Contacts per deal stage, answered from the contacts_stage index alone."""
+        return Counter(dict(self._db.execute(
+            "SELECT json_extract(data, '$.deal_stage'), COUNT(*) FROM contacts GROUP BY 1"
+        )))
+
+    def pipeline_rows(self) -> List[Tuple]:
+        """(stage, id, name, company, value) per contact, extracted in SQL without decoding records."""
+        return self._db.execute(
+            "SELECT COALESCE(json_extract(data, '$.deal_stage'), 'lead'), id, "
+            "json_extract(data, '$.name'), COALESCE(json_extract(data, '$.company'), ''), "
+            "COALESCE(json_extract(data, '$.deal_value'), 0) FROM contacts ORDER BY rowid"
+        ).fetchall()
+
+    def count(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM contacts").fetchone()[0]
+
+    def recent(self, limit: int) -> List[Dict]:
+        rows = self._rows("SELECT data FROM contacts ORDER BY rowid DESC LIMIT ?", (limit,))
+        rows.reverse()
+        return rows
+
+
+def _search_text(contact: Dict) -> str:
+    """Lowercased searchable fields, joined with a separator no query will contain."""
+    parts = [contact.get("name", ""), contact.get("company", ""), contact.get("email", ""),
+             contact.get("role", ""), *contact.get("tags", [])]
+    return "\x1f".join(str(p) for p in parts).lower()
+
+
+_store: Optional[ContactStore] = None
+
+
+def _get_store() -> ContactStore:
+    global _store
+    if _store is None:
+        _store = ContactStore()
+    return _store
+
+
 # ─── Contacts ────────────────────────────────────────────────────────────────
 
-def add_contact(name: str, **kwargs) -> Dict:
-    contacts = _load(CONTACTS_FILE)
-    contact = {
+def _new_contact(name: str, **kwargs) -> Dict:
+    now = datetime.now().isoformat()
+    return {
         "id": _gen_id(),
         "name": name,
         "email": kwargs.get("email", ""),
@@ -81,80 +322,89 @@ def add_contact(name: str, **kwargs) -> Dict:
         "deal_value": 0,
         "notes": kwargs.get("notes", ""),
         "interactions": [],
-        "created_at": datetime.now().isoformat(),
-        "updated_at": datetime.now().isoformat(),
+        "created_at": now,
+        "updated_at": now,
     }
-    contacts.append(contact)
-    _save(CONTACTS_FILE, contacts)
+
+
+def add_contact(name: str, **kwargs) -> Dict:
+    contact = _new_contact(name, **kwargs)
+    _get_store().append(contact)
     return contact
 
 
 def list_contacts(stage: str = None, tag: str = None, source: str = None) -> List[Dict]:
-    contacts = _load(CONTACTS_FILE)
-    if stage:
-        contacts = [c for c in contacts if c.get("deal_stage") == stage]
-    if tag:
-        contacts = [c for c in contacts if tag in c.get("tags", [])]
-    if source:
-        contacts = [c for c in contacts if c.get("source") == source]
-    return contacts
+    return _get_store().filter(stage, tag, source)
 
 
 def search_contacts(query: str) -> List[Dict]:
-    contacts = _load(CONTACTS_FILE)
-    q = query.lower()
-    return [c for c in contacts if q in c.get("name", "").lower()
-            or q in c.get("company", "").lower()
-            or q in c.get("email", "").lower()
-            or q in c.get("role", "").lower()
-            or any(q in t for t in c.get("tags", []))]
+    store = _get_store()
+    if store.fts:
+        return store.search(query)
+    return store.substring_search(query)
 
 
 def view_contact(contact_id: str) -> Optional[Dict]:
-    contacts = _load(CONTACTS_FILE)
-    for c in contacts:
-        if c["id"] == contact_id:
-            return c
-    return None
+    return _get_store().get(contact_id)
 
 
 def update_deal(contact_id: str, stage: str, value: int = None) -> Optional[Dict]:
-    contacts = _load(CONTACTS_FILE)
-    for c in contacts:
-        if c["id"] == contact_id:
-            if stage not in DEAL_STAGES:
-                print(f"Invalid stage. Must be one of: {', '.join(DEAL_STAGES)}", file=sys.stderr)
-                return None
-            c["deal_stage"] = stage
-            if value is not None:
-                c["deal_value"] = value
-            c["updated_at"] = datetime.now().isoformat()
-            _save(CONTACTS_FILE, contacts)
-            return c
-    print(f"Contact {contact_id} not found", file=sys.stderr)
-    return None
+    if stage not in DEAL_STAGES:
+        print(f"Invalid stage. Must be one of: {', '.join(DEAL_STAGES)}", file=sys.stderr)
+        return None
+    patch = {"deal_stage": stage, "updated_at": datetime.now().isoformat()}
+    if value is not None:
+        patch["deal_value"] = value
+    c = _get_store().update(contact_id, patch)
+    if c is None:
+        print(f"Contact {contact_id} not found", file=sys.stderr)
+    return c
 
 
 def add_interaction(contact_id: str, interaction_type: str, note: str) -> Optional[Dict]:
-    contacts = _load(CONTACTS_FILE)
-    for c in contacts:
-        if c["id"] == contact_id:
-            interaction = {
-                "type": interaction_type,
-                "note": note,
-                "timestamp": datetime.now().isoformat(),
-            }
-            c.setdefault("interactions", []).append(interaction)
-            c["updated_at"] = datetime.now().isoformat()
-            _save(CONTACTS_FILE, contacts)
-            return c
-    return None
+    store = _get_store()
+    c = store.get(contact_id)
+    if c is None:
+        return None
+    now = datetime.now().isoformat()
+    interaction = {
+        "type": interaction_type,
+        "note": note,
+        "timestamp": now,
+    }
+    interactions = c.get("interactions", []) + [interaction]
+    return store.update(contact_id, {"interactions": interactions, "updated_at": now})
 
 
 # ─── Follow-ups ──────────────────────────────────────────────────────────────
 
-def schedule_followup(contact_id: str, follow_date: str, note: str) -> Dict:
+class _FollowupDates:
+    """Read-only view of follow-up dates so bisect can search the list without a key function."""
+
+    def __init__(self, followups: list):
+        self._followups = followups
+
+    def __len__(self) -> int:
+        return len(self._followups)
+
+    def __getitem__(self, i: int) -> str:
+        return self._followups[i]["date"]
+
+
+def _load_followups() -> list:
+    """Follow-ups ordered by date (files written before ordering was kept are sorted on load)."""
     followups = _load(FOLLOWUPS_FILE)
+    followups.sort(key=lambda f: f["date"])  # linear when already sorted
+    return followups
+
+
+def _split_followups(followups: list, today: str) -> int:
+    """Index of the first follow-up dated after ``today``."""
+    return bisect.bisect_right(_FollowupDates(followups), today)
+
+
+def schedule_followup(contact_id: str, follow_date: str, note: str) -> Dict:
+    followups = _load_followups()
     contact = view_contact(contact_id)
     followup = {
         "id": _gen_id(),
@@ -165,48 +415,52 @@ def schedule_followup(contact_id: str, follow_date: str, note: str) -> Dict:
         "status": "pending",
         "created_at": datetime.now().isoformat(),
     }
-    followups.append(followup)
+    followups.insert(bisect.bisect_right(_FollowupDates(followups), follow_date), followup)
     _save(FOLLOWUPS_FILE, followups)
     return followup
 
 
 def get_overdue() -> List[Dict]:
-    followups = _load(FOLLOWUPS_FILE)
-    today = date.today().isoformat()
-    return [f for f in followups if f["status"] == "pending" and f["date"] <= today]
+    followups = _load_followups()
+    split = _split_followups(followups, date.today().isoformat())
+    return [f for f in followups[:split] if f["status"] == "pending"]
 
 
 # ─── Pipeline ────────────────────────────────────────────────────────────────
 
+def _aggregate_pipeline(rows: List[Tuple]) -> Tuple[Counter, Counter, Dict[str, List[Dict]]]:
+    """One pass over pipeline rows producing per-stage counts, value totals and deal items."""
+    stage_counts = Counter()
+    stage_totals = Counter()
+    stage_items = defaultdict(list)
+    for stage, contact_id, name, company, value in rows:
+        stage_counts[stage] += 1
+        stage_totals[stage] += value
+        stage_items[stage].append({"id": contact_id, "name": name, "company": company, "value": value})
+    return stage_counts, stage_totals, stage_items
+
+
 def get_pipeline() -> Dict:
-    contacts = _load(CONTACTS_FILE)
-    pipeline = {stage: [] for stage in DEAL_STAGES}
-    for c in contacts:
-        stage = c.get("deal_stage", "lead")
-        pipeline.setdefault(stage, []).append({
-            "id": c["id"],
-            "name": c["name"],
-            "company": c.get("company", ""),
-            "value": c.get("deal_value", 0),
-        })
-    summary = {stage: {"count": len(items), "total_value": sum(i.get("value", 0) for i in items), "contacts": items}
-               for stage, items in pipeline.items()}
-    return summary
+    stage_counts, stage_totals, stage_items = _aggregate_pipeline(_get_store().pipeline_rows())
+    stages = DEAL_STAGES + [s for s in stage_items if s not in DEAL_STAGES]
+    return {stage: {"count": stage_counts[stage], "total_value": stage_totals[stage], "contacts": stage_items.get(stage, [])}
+            for stage in stages}
 
 
 def dashboard() -> Dict:
-    contacts = _load(CONTACTS_FILE)
-    followups = _load(FOLLOWUPS_FILE)
-    today = date.today().isoformat()
-    overdue = [f for f in followups if f["status"] == "pending" and f["date"] <= today]
-    upcoming = [f for f in followups if f["status"] == "pending" and f["date"] > today][:5]
+    store = _get_store()
+    followups = _load_followups()
+    split = _split_followups(followups, date.today().isoformat())
+    overdue = [f for f in followups[:split] if f["status"] == "pending"]
+    upcoming = list(islice((f for f in followups[split:] if f["status"] == "pending"), 5))
+    stage_counts = store.stage_counts()
 
     return {
-        "total_contacts": len(contacts),
-        "pipeline": {stage: sum(1 for c in contacts if c.get("deal_stage") == stage) for stage in DEAL_STAGES},
+        "total_contacts": store.count(),
+        "pipeline": {stage: stage_counts[stage] for stage in DEAL_STAGES},
         "overdue_followups": len(overdue),
         "upcoming_followups": [{"contact": f["contact_name"], "date": f["date"], "note": f["note"]} for f in upcoming],
-        "recent_contacts": [{"id": c["id"], "name": c["name"], "company": c.get("company")} for c in contacts[-5:]],
+        "recent_contacts": [{"id": c["id"], "name": c["name"], "company": c.get("company")} for c in store.recent(5)],
     }
 
 
@@ -218,42 +472,45 @@ def import_contacts(filepath: str, fmt: str = "csv") -> Dict:
         print(f"File not found: {filepath}", file=sys.stderr)
         sys.exit(1)
 
-    imported = 0
+    contacts = []
     if fmt == "csv":
         with open(path, 'r', encoding='utf-8') as f:
             reader = csv.DictReader(f)
             for row in reader:
                 name = row.get("name", row.get("Name", ""))
                 if name:
-                    add_contact(name, **{k.lower(): v for k, v in row.items() if k.lower() != "name"})
-                    imported += 1
+                    contacts.append(_new_contact(name, **{k.lower(): v for k, v in row.items() if k.lower() != "name"}))
     elif fmt == "json":
-        data = json.loads(path.read_text())
+        data = orjson.loads(path.read_bytes())
         for item in (data if isinstance(data, list) else [data]):
             name = item.pop("name", "Unknown")
-            add_contact(name, **item)
-            imported += 1
+            contacts.append(_new_contact(name, **item))
 
-    return {"imported": imported, "file": filepath}
+    _get_store().append_many(contacts)
+    return {"imported": len(contacts), "file": filepath}
 
 
 def export_contacts(fmt: str = "csv", output: str = None) -> str:
-    contacts = _load(CONTACTS_FILE)
+    contacts = _get_store().iter_all()
     if not output:
         output = f"output/contacts_export.{fmt}"
 
     Path(output).parent.mkdir(parents=True, exist_ok=True)
 
     if fmt == "csv":
-        if contacts:
+        first = next(contacts, None)
+        if first is not None:
             keys = ["id", "name", "email", "company", "role", "phone", "linkedin", "twitter",
                      "deal_stage", "deal_value", "source", "created_at"]
             with open(output, 'w', newline='', encoding='utf-8') as f:
                 writer = csv.DictWriter(f, fieldnames=keys, extrasaction='ignore')
                 writer.writeheader()
-                writer.writerows(contacts)
+                writer.writerow(first)
+                for c in contacts:
+                    writer.writerow(c)
     elif fmt == "json":
-        Path(output).write_text(json.dumps(contacts, indent=2, default=str))
+        with open(output, 'wb') as f:
+            _write_json(f, contacts)
 
     return output
 
@@ -322,40 +579,43 @@ def main():
         sys.exit(0)
 
     if args.command == "dashboard":
-        print(json.dumps(dashboard(), indent=2))
+        _emit(dashboard())
     elif args.command == "add":
         result = add_contact(args.name, email=args.email, company=args.company, role=args.role,
                              phone=args.phone, linkedin=args.linkedin, twitter=args.twitter,
                              tags=args.tags, source=args.source, notes=args.notes)
-        print(json.dumps(result, indent=2))
+        _emit(result)
     elif args.command == "list":
-        print(json.dumps(list_contacts(args.stage, args.tag, args.source), indent=2))
+        _emit(list_contacts(args.stage, args.tag, args.source))
     elif args.command == "search":
-        print(json.dumps(search_contacts(args.query), indent=2))
+        _emit(search_contacts(args.query))
     elif args.command == "view":
         result = view_contact(args.id)
-        print(json.dumps(result, indent=2) if result else "Contact not found")
+        if result:
+            _emit(result)
+        else:
+            print("Contact not found")
     elif args.command == "deal":
         result = update_deal(args.id, args.stage, args.value)
         if result:
-            print(json.dumps(result, indent=2))
+            _emit(result)
     elif args.command == "followup":
         result = schedule_followup(args.id, args.date, args.note)
-        print(json.dumps(result, indent=2))
+        _emit(result)
     elif args.command == "overdue":
-        print(json.dumps(get_overdue(), indent=2))
+        _emit(get_overdue())
     elif args.command == "pipeline":
-        print(json.dumps(get_pipeline(), indent=2))
+        _emit(get_pipeline())
     elif args.command == "import":
         result = import_contacts(args.file, args.fmt)
-        print(json.dumps(result, indent=2))
+        _emit(result)
     elif args.command == "export":
         output = export_contacts(args.fmt, args.output)
         print(f"Exported to: {output}")
     elif args.command == "interaction":
         result = add_interaction(args.id, args.type, args.note)
         if result:
-            print(json.dumps(result, indent=2))
+            _emit(result)
         else:
             print("Contact not found")
 
@@ -18,45 +18,186 @@ Usage:
 """
 
 import argparse
+import asyncio
 import csv
 import dns.resolver
+import functools
 import json
 import re
+import sqlite3
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
+
+try:
+    import aiodns
+    import pycares
+    AIODNS_AVAILABLE = True
+except ImportError:
+    AIODNS_AVAILABLE = False
 
 # Common disposable email domains
-DISPOSABLE_DOMAINS = {
+DISPOSABLE_DOMAINS = frozenset({
     "mailinator.com", "guerrillamail.com", "tempmail.com", "throwaway.email",
     "yopmail.com", "sharklasers.com", "guerrillamailblock.com", "grr.la",
     "dispostable.com", "maildrop.cc", "10minutemail.com", "trashmail.com",
     "temp-mail.org", "fakeinbox.com", "getnada.com", "mohmal.com",
     "burnermail.io", "tempail.com", "emailondeck.com", "mintemail.com",
-}
+})
 
-ROLE_PREFIXES = {
+ROLE_PREFIXES = frozenset({
     "info", "admin", "support", "sales", "contact", "help", "office",
     "billing", "accounts", "hr", "marketing", "press", "media",
     "webmaster", "postmaster", "abuse", "noreply", "no-reply",
-}
+})
+
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\Z')
+
+# Bulk verification is DNS-bound, so lookups are fanned out across threads
+BULK_WORKERS = 64
+ASYNC_CONCURRENCY = 256  # in-flight queries when aiodns is available
+DNS_CACHE_SIZE = 4096
+
+# Cross-run cache of raw DNS answers, expired by record TTL
+DNS_CACHE_FILE = Path("output/accounts/dns_cache.sqlite")
+NEGATIVE_TTL = 300  # seconds to remember NXDOMAIN / empty answers
+
+_resolver: Optional[dns.resolver.Resolver] = None
+_local = threading.local()
+
+
+def _get_resolver() -> dns.resolver.Resolver:
+    """Shared resolver so resolv.conf is parsed once rather than per lookup."""
+    global _resolver
+    if _resolver is None:
+        _resolver = dns.resolver.Resolver()
+    return _resolver
+
+
+def _cache_db() -> Optional[sqlite3.Connection]:
+    """Per-thread connection to the on-disk DNS cache (None if unavailable)."""
+    if not hasattr(_local, "db"):
+        try:
+            DNS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(DNS_CACHE_FILE, timeout=10)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS dns_cache ("
+                "domain TEXT, rtype TEXT, payload BLOB, expires REAL, "
+                "PRIMARY KEY (domain, rtype))"
+            )
+            _local.db = db
+        except (sqlite3.Error, OSError):
+            _local.db = None
+    return _local.db
+
+
+def _cache_get(name: str, rtype: str) -> Optional[Dict]:
+    db = _cache_db()
+    if db is None:
+        return None
+    try:
+        row = db.execute(
+            "SELECT payload FROM dns_cache WHERE domain = ? AND rtype = ? AND expires > ?",
+            (name, rtype, time.time()),
+        ).fetchone()
+    except sqlite3.Error:
+        return None
+    return json.loads(row[0]) if row else None
+
+
+def _cache_put(name: str, rtype: str, payload: Dict, ttl: float):
+    db = _cache_db()
+    if db is None:
+        return
+    try:
+        with db:
+            db.execute(
+                "INSERT OR REPLACE INTO dns_cache (domain, rtype, payload, expires) VALUES (?, ?, ?, ?)",
+                (name, rtype, json.dumps(payload), time.time() + ttl),
+            )
+    except sqlite3.Error:
+        pass
+
+
+def _resolve(name: str, rtype: str) -> list:
+    """Resolve MX or TXT records, consulting the on-disk cache first.
+
+    MX answers come back as [preference, host] pairs, TXT answers as strings.
+    Cached NXDOMAIN / NoAnswer results are re-raised as the original exception.
+    """
+    cached = _cache_get(name, rtype)
+    if cached is not None:
+        if cached.get("error") == "nxdomain":
+            raise dns.resolver.NXDOMAIN()
+        if cached.get("error") == "noanswer":
+            raise dns.resolver.NoAnswer()
+        return cached["records"]
+
+    try:
+        answers = _get_resolver().resolve(name, rtype)
+    except dns.resolver.NXDOMAIN:
+        _cache_put(name, rtype, {"error": "nxdomain"}, NEGATIVE_TTL)
+        raise
+    except dns.resolver.NoAnswer:
+        _cache_put(name, rtype, {"error": "noanswer"}, NEGATIVE_TTL)
+        raise
+    except Exception:
+        _local.transient = True
+        raise
+
+    if rtype == 'MX':
+        records = [[r.preference, str(r.exchange)] for r in answers]
+    else:
+        records = [str(r) for r in answers]
+    _cache_put(name, rtype, {"records": records}, answers.rrset.ttl)
+    return records
+
+
+def _memo_definitive(fn):
+    """Like ``lru_cache``, but results produced by a transient DNS failure are not kept.
+
+    Only record sets, NXDOMAIN and NoAnswer are memoized; a timeout or unreachable
+    nameserver is retried on the next call, as each row would be without the memo.
+    """
+    cache: Dict[tuple, Dict] = {}
+    lock = threading.Lock()
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        key = args + tuple(sorted(kwargs.items()))
+        with lock:
+            if key in cache:
+                return cache[key]
+        _local.transient = False
+        result = fn(*args, **kwargs)
+        if not _local.transient:
+            with lock:
+                if len(cache) >= DNS_CACHE_SIZE:
+                    cache.pop(next(iter(cache)))
+                cache[key] = result
+        return result
+
+    wrapper.cache_clear = cache.clear
+    return wrapper
 
 
 def validate_syntax(email: str) -> bool:
     """Check if email matches RFC 5322 basic pattern."""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL_RE.match(email))
 
 
+@_memo_definitive
 def check_mx(domain: str) -> Dict:
     """Look up MX records for domain."""
     try:
-        answers = dns.resolver.resolve(domain, 'MX')
-        records = sorted(
-            [{"priority": r.preference, "host": str(r.exchange).rstrip('.')} for r in answers],
-            key=lambda x: x["priority"]
-        )
-        return {"valid": True, "records": records}
+        answers = _resolve(domain, 'MX')
+        pairs = [(pref, host.rstrip('.')) for pref, host in answers]
+        pairs.sort()  # native tuple ordering: priority, then host
+        return {"valid": True, "records": [{"priority": p, "host": h} for p, h in pairs]}
     except (dns.resolver.NoAnswer, dns.resolver.NXDOMAIN):
         return {"valid": False, "records": [], "error": "No MX records found"}
     except dns.resolver.NoNameservers:
@@ -65,12 +206,13 @@ def check_mx(domain: str) -> Dict:
         return {"valid": False, "records": [], "error": str(e)}
 
 
+@_memo_definitive
 def check_spf(domain: str) -> Dict:
     """Check SPF record for domain."""
     try:
-        answers = dns.resolver.resolve(domain, 'TXT')
+        answers = _resolve(domain, 'TXT')
         for rdata in answers:
-            txt = str(rdata).strip('"')
+            txt = rdata.strip('"')
             if txt.startswith('v=spf1'):
                 return {"valid": True, "record": txt}
         return {"valid": False, "error": "No SPF record found"}
@@ -78,13 +220,14 @@ def check_spf(domain: str) -> Dict:
         return {"valid": False, "error": str(e)}
 
 
+@_memo_definitive
 def check_dkim(domain: str, selector: str = "default") -> Dict:
     """Check DKIM record for domain."""
     dkim_domain = f"{selector}._domainkey.{domain}"
     try:
-        answers = dns.resolver.resolve(dkim_domain, 'TXT')
+        answers = _resolve(dkim_domain, 'TXT')
         for rdata in answers:
-            txt = str(rdata).strip('"')
+            txt = rdata.strip('"')
             if 'v=DKIM1' in txt or 'p=' in txt:
                 return {"valid": True, "selector": selector, "record": txt[:100] + "..."}
         return {"valid": False, "error": f"No DKIM record at {dkim_domain}"}
@@ -92,13 +235,14 @@ def check_dkim(domain: str, selector: str = "default") -> Dict:
         return {"valid": False, "error": str(e)}
 
 
+@_memo_definitive
 def check_dmarc(domain: str) -> Dict:
     """Check DMARC record for domain."""
     dmarc_domain = f"_dmarc.{domain}"
     try:
-        answers = dns.resolver.resolve(dmarc_domain, 'TXT')
+        answers = _resolve(dmarc_domain, 'TXT')
         for rdata in answers:
-            txt = str(rdata).strip('"')
+            txt = rdata.strip('"')
             if txt.startswith('v=DMARC1'):
                 return {"valid": True, "record": txt}
         return {"valid": False, "error": "No DMARC record found"}
@@ -166,9 +310,35 @@ def verify_email(email: str) -> Dict:
     return result
 
 
+async def _prefetch_mx_async(domains: Iterable[str]):
+    """Resolve MX for many domains concurrently via aiodns, writing answers to the DNS cache."""
+    resolver = aiodns.DNSResolver()
+    semaphore = asyncio.Semaphore(ASYNC_CONCURRENCY)
+
+    async def fetch(domain: str):
+        if _cache_get(domain, 'MX') is not None:
+            return
+        async with semaphore:
+            try:
+                result = await resolver.query_dns(domain, 'MX')
+            except aiodns.error.DNSError as e:
+                code = e.args[0] if e.args else None
+                if code == aiodns.error.ARES_ENOTFOUND:
+                    _cache_put(domain, 'MX', {"error": "nxdomain"}, NEGATIVE_TTL)
+                elif code == aiodns.error.ARES_ENODATA:
+                    _cache_put(domain, 'MX', {"error": "noanswer"}, NEGATIVE_TTL)
+                return
+        answers = [r for r in result.answer if r.type == pycares.QUERY_TYPE_MX]
+        records = [[r.data.priority, r.data.exchange] for r in answers]
+        ttl = min((r.ttl for r in answers), default=NEGATIVE_TTL)
+        _cache_put(domain, 'MX', {"records": records}, ttl)
+
+    await asyncio.gather(*(fetch(d) for d in domains))
+
+
 def verify_bulk(filepath: str, email_column: str = "email") -> List[Dict]:
     """Verify a list of emails from a CSV file."""
-    results = []
+    emails = []
     path = Path(filepath)
 
     if not path.exists():
@@ -184,10 +354,24 @@ def verify_bulk(filepath: str, email_column: str = "email") -> List[Dict]:
         for row in reader:
             email = row.get(email_column, '').strip()
             if email:
-                result = verify_email(email)
-                results.append(result)
-
-    return results
+                emails.append(email)
+
+    # Resolve each distinct domain once up front; per-row checks then hit the MX cache
+    domains = set()
+    for email in emails:
+        email = email.lower()
+        if validate_syntax(email):
+            domain = email.rsplit('@', 1)[1]
+            if not is_disposable(domain):
+                domains.add(domain)
+    # aiodns fills the on-disk cache without a thread per query; the pool then
+    # loads those answers into check_mx's memo and resolves anything aiodns missed
+    if AIODNS_AVAILABLE and _cache_db() is not None:
+        asyncio.run(_prefetch_mx_async(domains))
+    with ThreadPoolExecutor(max_workers=BULK_WORKERS) as executor:
+        list(executor.map(check_mx, domains))
+
+    return [verify_email(email) for email in emails]
 
 
 def verify_domain(domain: str) -> Dict:
@@ -22,16 +22,17 @@ from datetime import datetime, timedelta, date
 from pathlib import Path
 from typing import Dict, List
 
+from account_manager import _gen_id, _get_store, list_contacts
+from qa_checker import iter_reviews
+
 DATA_DIR = Path("output/integrations")
 SYNC_LOG = DATA_DIR / "sync_log.json"
 CONNECTIONS_FILE = DATA_DIR / "connections.json"
 
-# Where other skills store data
-CONTACTS_FILE = Path("output/accounts/contacts.json")
+# Where other skills store data (contacts live in account_manager's ContactStore)
 CAMPAIGNS_DIR = Path("output/campaigns")
 TICKETS_DIR = Path("output/tickets")
 DISCOVERY_DIR = Path("output/discovery")
-QA_DIR = Path("output/qa")
 
 
 def _ensure_dirs():
@@ -134,9 +135,10 @@ def import_data(filepath: str, fmt: str = "csv") -> Dict:
 
             # Auto-detect: if has 'name' and 'email' columns, import as contacts
             if rows and ("name" in rows[0] or "Name" in rows[0]):
-                contacts = _load(CONTACTS_FILE)
+                contacts = []
                 for row in rows:
                     contacts.append({
+                        "id": _gen_id(),
                         "name": row.get("name", row.get("Name", "")),
                         "email": row.get("email", row.get("Email", "")),
                         "company": row.get("company", row.get("Company", "")),
@@ -144,7 +146,7 @@ def import_data(filepath: str, fmt: str = "csv") -> Dict:
                         "source": f"import:{path.name}",
                         "imported_at": datetime.now().isoformat(),
                     })
-                _save(CONTACTS_FILE, contacts)
+                _get_store().append_many(contacts)
 
     elif fmt == "json":
         data = json.loads(path.read_text())
@@ -165,7 +167,7 @@ def import_data(filepath: str, fmt: str = "csv") -> Dict:
 def export_data(data_type: str, fmt: str = "csv", output: str = None) -> Dict:
     # Load data based on type
     if data_type == "contacts":
-        data = _load(CONTACTS_FILE)
+        data = list_contacts()
         keys = ["id", "name", "email", "company", "role", "phone", "deal_stage", "deal_value", "source"]
     elif data_type == "campaigns":
         data = []
@@ -184,8 +186,7 @@ def export_data(data_type: str, fmt: str = "csv", output: str = None) -> Dict:
                 data.extend(_load(f) if isinstance(_load(f), list) else [_load(f)])
         keys = None
     elif data_type == "reviews":
-        reviews_file = QA_DIR / "reviews.json"
-        data = _load(reviews_file)
+        data = list(iter_reviews())
         keys = None
     else:
         return {"error": f"Unknown data type: {data_type}. Use: contacts, campaigns, tickets, discovery, reviews"}
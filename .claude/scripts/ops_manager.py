@@ -8,18 +8,74 @@ Usage:
   python ops_manager.py logs --tail 20   # View recent logs
   python ops_manager.py cleanup --days 30 # Clean old files
   python ops_manager.py backup --output output/backups/
+  python ops_manager.py backup --format zst  # tar + zstd (needs zstandard)
   python ops_manager.py reset            # Reset rate limiters
 """
 
 import argparse
+import heapq
 import json
+import mmap
 import os
 import shutil
 import sys
+import tarfile
 import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
+try:
+    import orjson
+
+    def _dumps(obj, indent: bool = True) -> str:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option, default=str).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj, indent: bool = True) -> str:
+        return json.dumps(obj, indent=2 if indent else None, default=str)
+
+    _loads = json.loads
+
+# Optional SIMD DEFLATE/CRC32 drop-ins for backup archives
+try:
+    from isal import isal_zlib as _fast_zlib
+    BACKUP_LEVEL = _fast_zlib.ISAL_DEFAULT_COMPRESSION  # isal levels are 0-3
+except ImportError:
+    try:
+        from zlib_ng import zlib_ng as _fast_zlib
+        BACKUP_LEVEL = 6
+    except ImportError:
+        _fast_zlib = None
+        BACKUP_LEVEL = 6
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+
+def _dir_names(path: str) -> frozenset:
+    """Names present in a directory (empty if it does not exist)."""
+    try:
+        with os.scandir(path) as it:
+            return frozenset(entry.name for entry in it)
+    except OSError:
+        return frozenset()
+
+
+def _file_contains(path: str, needle: bytes) -> bool:
+    """Byte search over a memory-mapped file, without reading or decoding it."""
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm.find(needle) != -1
+    except (OSError, ValueError):  # ValueError: empty files cannot be mapped
+        return False
+
 
 def check_status() -> dict:
     """Run full system health check."""
@@ -29,98 +85,295 @@ def check_status() -> dict:
     checks["python"] = {"ok": True, "version": sys.version.split()[0]}
 
     # Node.js
-    node_ok = os.system("node --version > /dev/null 2>&1") == 0 or os.system("node --version >nul 2>&1") == 0
-    checks["node"] = {"ok": node_ok}
+    node_path = shutil.which("node")  # PATH lookup only, no subprocess
+    checks["node"] = {"ok": node_path is not None, "path": node_path}
+
+    # One directory listing per parent instead of a stat() per probed path
+    root, claude, output = _dir_names("."), _dir_names(".claude"), _dir_names("output")
 
     # Canvas
-    canvas_deps = Path("tldraw-canvas/node_modules").exists()
+    canvas_deps = "tldraw-canvas" in root and "node_modules" in _dir_names("tldraw-canvas")
     checks["canvas"] = {"ok": canvas_deps, "note": "Run: cd tldraw-canvas && npm install" if not canvas_deps else "Ready"}
 
     # Gmail OAuth
-    creds = Path(".claude/credentials.json").exists() or Path("credentials.json").exists()
-    token = Path(".claude/token.json").exists() or Path("token.json").exists()
+    creds = "credentials.json" in claude or "credentials.json" in root
+    token = "token.json" in claude or "token.json" in root
     checks["gmail_oauth"] = {"ok": creds, "credentials": creds, "token": token}
 
     # Exa API key
     exa_key = bool(os.environ.get("EXA_API_KEY"))
     if not exa_key:
         for env_file in [".env", ".env.local"]:
-            if Path(env_file).exists():
-                content = Path(env_file).read_text()
-                if "EXA_API_KEY=" in content:
-                    exa_key = True
-                    break
+            if env_file in root and _file_contains(env_file, b"EXA_API_KEY="):
+                exa_key = True
+                break
     checks["exa_api"] = {"ok": exa_key}
 
     # Output directories
     output_dirs = ["output/workflows", "output/logs", "output/discovery", "output/reports"]
-    missing = [d for d in output_dirs if not Path(d).exists()]
+    missing = [d for d in output_dirs if d.split("/", 1)[1] not in output]
     checks["output_dirs"] = {"ok": len(missing) == 0, "missing": missing}
 
     # Rate limiter
-    rate_file = Path("output/rate_limits.json")
-    checks["rate_limiter"] = {"ok": rate_file.exists()}
+    checks["rate_limiter"] = {"ok": "rate_limits.json" in output}
 
     # Team config
-    team_file = Path("output/team.json") if Path("output/team.json").exists() else Path(".claude/team.json")
-    checks["team_config"] = {"ok": team_file.exists()}
+    checks["team_config"] = {"ok": "team.json" in output or "team.json" in claude}
 
     # Overall
     all_ok = all(c.get("ok", False) for c in checks.values())
     return {"healthy": all_ok, "checks": checks, "timestamp": datetime.now().isoformat()}
 
 
+LOG_SUFFIXES = (".json", ".jsonl")
+CLEANUP_WORKERS = 16
+LOG_INDEX = ".index.json"  # {relpath: [mtime, size, first_timestamp, last_timestamp]}
+_TAIL_CHUNK = 64 * 1024
+
+
+def _scandir_files(path: str, suffixes: tuple = None):
+    """Recursively yield DirEntry objects for files under path (optionally by suffix)."""
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _scandir_files(entry.path, suffixes)
+                elif entry.is_file(follow_symlinks=False) and (suffixes is None or entry.name.endswith(suffixes)):
+                    yield entry
+    except OSError:
+        return
+
+
+def _reverse_lines(f):
+    """Yield the lines of a binary file last-to-first, reading 64 KiB blocks from the end."""
+    f.seek(0, os.SEEK_END)
+    pos = f.tell()
+    rest = b""
+    while pos > 0:
+        size = min(_TAIL_CHUNK, pos)
+        pos -= size
+        f.seek(pos)
+        lines = (f.read(size) + rest).split(b"\n")
+        rest = lines.pop(0)
+        yield from reversed(lines)
+    yield rest
+
+
+def _read_log_records(path: str):
+    """Yield log records newest-first.
+
+    JSON Lines files are streamed from the end so only the lines actually consumed
+    are parsed; a partial last line (a writer mid-append) is skipped. Legacy files
+    holding a JSON array or a single (pretty-printed) object are loaded whole.
+    """
+    with open(path, "rb") as f:
+        # Most log files fit in one tail block: read them with a single call and split in memory
+        small = os.fstat(f.fileno()).st_size <= _TAIL_CHUNK
+        blob = f.read() if small else f.read(64)
+        if not blob.lstrip().startswith(b"["):
+            yielded = skipped_tail = False
+            for line in (reversed(blob.split(b"\n")) if small else _reverse_lines(f)):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = _loads(line)
+                except ValueError:
+                    if yielded:
+                        continue  # skip a corrupt line in an otherwise valid log
+                    if not skipped_tail:
+                        skipped_tail = True  # the last line may still be being written
+                        continue
+                    break  # not JSON Lines: fall back to a whole-file parse
+                yielded = True
+                yield record
+            else:
+                return
+        if not small:
+            f.seek(0)
+            blob = f.read()
+    data = _loads(blob)
+    if isinstance(data, list):
+        yield from reversed(data)
+    else:
+        yield data
+
+
+def _load_index(log_dir: Path) -> dict:
+    try:
+        return _loads((log_dir / LOG_INDEX).read_bytes())
+    except (OSError, ValueError):
+        return {}
+
+
+def _timestamp_range(path: str) -> tuple:
+    """(first, last) timestamp of a log file's records, or (None, None).
+
+    JSON Lines logs are append-only, so only the head line and the last complete
+    line are parsed and the cost stays flat as the file grows. Legacy JSON files
+    are read in full.
+    """
+    stamps = []
+    try:
+        with open(path, "rb") as f:
+            head = f.readline()
+        try:
+            first = _loads(head)
+        except ValueError:
+            first = None  # pretty-printed legacy JSON
+        if isinstance(first, dict):
+            records = (first, next(_read_log_records(path), None))
+        else:
+            records = _read_log_records(path)
+        for record in records:
+            if isinstance(record, dict) and record.get("timestamp"):
+                stamps.append(str(record["timestamp"]))
+    except Exception:
+        pass
+    return (min(stamps), max(stamps)) if stamps else (None, None)
+
+
+def _refresh_index(log_dir: Path) -> dict:
+    """Bring the log index up to date with one scandir pass.
+
+    Only files whose (mtime, size) changed since the last run are re-read; the
+    index is rewritten only when something was added, changed or removed.
+    """
+    index = _load_index(log_dir)
+    root = str(log_dir)
+    fresh = {}
+    changed = False
+    for entry in _scandir_files(root, LOG_SUFFIXES):
+        if entry.name == LOG_INDEX:
+            continue
+        rel = os.path.relpath(entry.path, root)
+        st = entry.stat()
+        cached = index.get(rel)
+        if cached and cached[0] == st.st_mtime and cached[1] == st.st_size:
+            fresh[rel] = cached
+        else:
+            fresh[rel] = [st.st_mtime, st.st_size, *_timestamp_range(entry.path)]
+            changed = True
+    if changed or len(fresh) != len(index):
+        try:
+            (log_dir / LOG_INDEX).write_text(_dumps(fresh, indent=False), encoding="utf-8")
+        except OSError:
+            pass
+    return fresh
+
+
 def view_logs(tail: int = 20, campaign: str = None, platform: str = None, level: str = None) -> list:
     """Read recent activity logs."""
     log_dir = Path("output/logs")
     if not log_dir.exists():
         return []
 
-    entries = []
-    for log_file in sorted(log_dir.glob("**/*.json"), key=lambda p: p.stat().st_mtime, reverse=True):
+    # Visit files by their newest entry timestamp (from the index), then by mtime
+    index = _refresh_index(log_dir)
+    files = sorted(index.items(), key=lambda item: (item[1][3] or "", item[1][0]), reverse=True)
+
+    # Lower-case the filters once; a single predicate checks all of them
+    camp = campaign.lower() if campaign else None
+    plat = platform.lower() if platform else None
+    lvl = level.lower() if level else None
+
+    def keep(e: dict) -> bool:
+        if camp and camp not in str(e.get("campaign", "")).lower():
+            return False
+        if plat and plat not in str(e.get("platform", "")).lower():
+            return False
+        if lvl and e.get("level", "").lower() != lvl:
+            return False
+        return True
+
+    if tail <= 0:
+        return []
+
+    # Newest files first. A min-heap holds the best `tail` matches as
+    # (timestamp, -seq, entry); once it is full, its root is the timestamp a file's
+    # newest entry, or a record within a file, must reach to still make the cut.
+    top = []
+    seq = 0
+    for rel, meta in files:
+        if len(top) >= tail and (meta[3] or "") < top[0][0]:
+            break  # files are ordered by newest entry, so no later file can place
         try:
-            data = json.loads(log_file.read_text())
-            if isinstance(data, list):
-                entries.extend(data)
-            elif isinstance(data, dict):
-                entries.append(data)
-        except (json.JSONDecodeError, Exception):
+            for e in _read_log_records(str(log_dir / rel)):
+                ts = e.get("timestamp", "")
+                if len(top) >= tail and ts < top[0][0]:
+                    break  # records come newest-first: the rest of this file is older
+                if not keep(e):
+                    continue
+                if len(top) < tail:
+                    heapq.heappush(top, (ts, -seq, e))
+                else:
+                    heapq.heappushpop(top, (ts, -seq, e))
+                seq += 1
+        except Exception:
             continue
 
-    # Apply filters
-    if campaign:
-        entries = [e for e in entries if campaign.lower() in str(e.get("campaign", "")).lower()]
-    if platform:
-        entries = [e for e in entries if platform.lower() in str(e.get("platform", "")).lower()]
-    if level:
-        entries = [e for e in entries if e.get("level", "").lower() == level.lower()]
+    # Newest `tail` by timestamp, ties in collection order
+    return [e for _, _, e in heapq.nlargest(tail, top)]
+
+
+def _lstat(entry: os.DirEntry):
+    """(path, stat) for a scanned entry, or None if it vanished or cannot be read."""
+    try:
+        return entry.path, entry.stat(follow_symlinks=False)
+    except OSError:
+        return None
 
-    # Sort by timestamp descending
-    entries.sort(key=lambda e: e.get("timestamp", ""), reverse=True)
-    return entries[:tail]
+
+def _unlink(path: str) -> bool:
+    try:
+        os.unlink(path)
+        return True
+    except OSError:
+        return False
 
 
 def cleanup(days: int = 30) -> dict:
     """Remove old logs and temporary files."""
     cutoff = datetime.now() - timedelta(days=days)
+    cutoff_ts = cutoff.timestamp()
     removed = {"files": 0, "bytes": 0}
 
-    for directory in ["output/logs", "output/reports"]:
-        dir_path = Path(directory)
-        if not dir_path.exists():
-            continue
-        for f in dir_path.rglob("*"):
-            if f.is_file() and datetime.fromtimestamp(f.stat().st_mtime) < cutoff:
-                size = f.stat().st_size
-                f.unlink()
+    entries = [e for d in ["output/logs", "output/reports"] for e in _scandir_files(d)]
+
+    # stat and unlink are syscall-bound and release the GIL, so fan them out
+    with ThreadPoolExecutor(max_workers=CLEANUP_WORKERS) as executor:
+        stats = filter(None, executor.map(_lstat, entries))
+        to_delete = [(path, st.st_size) for path, st in stats
+                     if st.st_mtime < cutoff_ts]
+        for (_, size), ok in zip(to_delete, executor.map(_unlink, [path for path, _ in to_delete])):
+            if ok:
                 removed["files"] += 1
                 removed["bytes"] += size
 
     return {"removed": removed, "cutoff_date": cutoff.isoformat()}
 
 
-def backup(output_dir: str = "output/backups") -> dict:
+def _add_backup_items(items: list, add) -> int:
+    """Feed every file under items to add(path, arcname); return items found."""
+    copied = 0
+    for item in items:
+        src = Path(item)
+        if src.is_dir():
+            for entry in _scandir_files(item):
+                add(entry.path, os.path.relpath(entry.path))
+        elif src.is_file():
+            add(item, item)
+        else:
+            continue
+        copied += 1
+    return copied
+
+
+def backup(output_dir: str = "output/backups", fmt: str = "zip") -> dict:
     """Create a timestamped backup of all data."""
+    if fmt == "zst" and not ZSTD_AVAILABLE:
+        return {"error": "zstandard not installed. Run: pip install zstandard"}
+
     Path(output_dir).mkdir(parents=True, exist_ok=True)
     timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
     backup_name = f"backup-{timestamp}"
@@ -135,24 +388,28 @@ def backup(output_dir: str = "output/backups") -> dict:
         "output/rate_limits.json",
     ]
 
-    backup_path.mkdir(parents=True, exist_ok=True)
-    copied = 0
-    for item in items_to_backup:
-        src = Path(item)
-        if src.exists():
-            dst = backup_path / item
-            dst.parent.mkdir(parents=True, exist_ok=True)
-            if src.is_dir():
-                shutil.copytree(src, dst, dirs_exist_ok=True)
-            else:
-                shutil.copy2(src, dst)
-            copied += 1
-
-    # Create zip
-    zip_path = shutil.make_archive(str(backup_path), 'zip', str(backup_path))
-    shutil.rmtree(backup_path)
+    # Stream straight into the archive: no staging copy, no rmtree pass
+    if fmt == "zst":
+        archive_path = f"{backup_path}.tar.zst"
+        cctx = zstandard.ZstdCompressor(level=3, threads=-1)
+        with open(archive_path, "wb") as out, cctx.stream_writer(out) as writer, \
+                tarfile.open(fileobj=writer, mode="w|") as tf:
+            copied = _add_backup_items(
+                items_to_backup, lambda path, arcname: tf.add(path, arcname=arcname, recursive=False))
+    else:
+        archive_path = f"{backup_path}.zip"
+        # Swap the fast DEFLATE/CRC32 into zipfile for this archive only
+        saved = zipfile.zlib, zipfile.crc32
+        if _fast_zlib is not None:
+            zipfile.zlib, zipfile.crc32 = _fast_zlib, _fast_zlib.crc32
+        try:
+            with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_DEFLATED,
+                                 compresslevel=BACKUP_LEVEL) as zf:
+                copied = _add_backup_items(items_to_backup, zf.write)
+        finally:
+            zipfile.zlib, zipfile.crc32 = saved
 
-    return {"backup": zip_path, "items_backed_up": copied, "timestamp": timestamp}
+    return {"backup": archive_path, "items_backed_up": copied, "timestamp": timestamp}
 
 
 def reset_rate_limits(platform: str = None) -> dict:
@@ -162,15 +419,15 @@ def reset_rate_limits(platform: str = None) -> dict:
         return {"reset": False, "error": "No rate_limits.json found"}
 
     if platform:
-        data = json.loads(rate_file.read_text())
+        data = _loads(rate_file.read_bytes())
         if platform in data:
             data[platform] = {}
-            rate_file.write_text(json.dumps(data, indent=2))
+            rate_file.write_text(_dumps(data), encoding="utf-8")
             return {"reset": True, "platform": platform}
         return {"reset": False, "error": f"Platform '{platform}' not found"}
 
     # Reset all
-    rate_file.write_text(json.dumps({}, indent=2))
+    rate_file.write_text(_dumps({}), encoding="utf-8")
     return {"reset": True, "platform": "all"}
 
 
@@ -191,6 +448,8 @@ def main():
 
     sp = subparsers.add_parser("backup", help="Backup all data")
     sp.add_argument("--output", default="output/backups")
+    sp.add_argument("--format", choices=["zip", "zst"], default="zip",
+                    help="Archive format (zst needs the zstandard package)")
 
     sp = subparsers.add_parser("reset", help="Reset rate limiters")
     sp.add_argument("--platform", help="Reset specific platform only")
@@ -202,19 +461,19 @@ def main():
         sys.exit(0)
 
     if args.command == "status":
-        print(json.dumps(check_status(), indent=2))
+        print(_dumps(check_status()))
     elif args.command == "logs":
         entries = view_logs(args.tail, args.campaign, args.platform, args.level)
-        print(json.dumps(entries, indent=2))
+        print(_dumps(entries))
     elif args.command == "cleanup":
         result = cleanup(args.days)
-        print(json.dumps(result, indent=2))
+        print(_dumps(result))
     elif args.command == "backup":
-        result = backup(args.output)
-        print(json.dumps(result, indent=2))
+        result = backup(args.output, args.format)
+        print(_dumps(result))
     elif args.command == "reset":
         result = reset_rate_limits(args.platform)
-        print(json.dumps(result, indent=2))
+        print(_dumps(result))
 
 
 if __name__ == "__main__":
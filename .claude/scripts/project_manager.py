@@ -17,43 +17,168 @@ Usage:
   python project_manager.py report <project_id>
   python project_manager.py milestone <project_id> "Milestone title" --due YYYY-MM-DD
 
-Data stored in: output/projects/
+Data stored in: output/projects/ (tasks are an append-only log in tasks.jsonl)
 """
 
 import argparse
 import json
+import os
 import sys
-import uuid
+from collections import Counter, namedtuple
 from datetime import datetime, timedelta, date
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import orjson
+
+    def _dumps(obj, indent: bool = True) -> str:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option, default=str).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj, indent: bool = True) -> str:
+        return json.dumps(obj, indent=2 if indent else None, default=str)
+
+    _loads = json.loads
 
 DATA_DIR = Path("output/projects")
 PROJECTS_FILE = DATA_DIR / "projects.json"
-TASKS_FILE = DATA_DIR / "tasks.json"
+TASKS_FILE = DATA_DIR / "tasks.jsonl"
+LEGACY_TASKS_FILE = DATA_DIR / "tasks.json"
 SPRINTS_FILE = DATA_DIR / "sprints.json"
 
 TASK_STATUSES = ["backlog", "todo", "in_progress", "review", "done"]
 PRIORITIES = ["low", "medium", "high", "critical"]
 
+# Rewrite tasks.jsonl once its log holds this many lines per live task
+COMPACT_RATIO = 10
+COMPACT_MIN_LINES = 100
+
+# Parsed files for this process, keyed by path and validated by (mtime_ns, size)
+_CACHE: Dict[Path, Tuple[Tuple[int, int], list]] = {}
+# Folded tasks.jsonl: (stat key, tasks by id, line count)
+_TASKS_CACHE: Optional[Tuple[Tuple[int, int], Dict[str, Dict], int]] = None
+
+# Tasks partitioned once for the reports; completed_by_day is keyed by completed_at[:10]
+TaskIndex = namedtuple("TaskIndex", ["tasks", "by_status", "by_project", "completed_by_day"])
+_INDEX_CACHE: Optional[Tuple[Tuple[int, int], TaskIndex]] = None
+
 
 def _ensure_dirs():
     DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def _stat_key(filepath: Path) -> Tuple[int, int]:
+    st = filepath.stat()
+    return st.st_mtime_ns, st.st_size
+
+
 def _load(filepath: Path) -> list:
-    if filepath.exists():
-        return json.loads(filepath.read_text())
-    return []
+    if not filepath.exists():
+        _CACHE.pop(filepath, None)
+        return []
+    key = _stat_key(filepath)
+    cached = _CACHE.get(filepath)
+    if cached and cached[0] == key:
+        return cached[1]
+    data = _loads(filepath.read_bytes())
+    _CACHE[filepath] = (key, data)
+    return data
 
 
 def _save(filepath: Path, data: list):
     _ensure_dirs()
-    filepath.write_text(json.dumps(data, indent=2, default=str))
+    filepath.write_text(_dumps(data), encoding="utf-8")
+    _CACHE[filepath] = (_stat_key(filepath), data)
+
+
+def _write_tasks(tasks: List[Dict]):
+    """Rewrite tasks.jsonl with one full record per live task."""
+    global _TASKS_CACHE
+    _ensure_dirs()
+    tmp = TASKS_FILE.with_suffix(".jsonl.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        for t in tasks:
+            f.write(_dumps(t, indent=False) + "\n")
+    os.replace(tmp, TASKS_FILE)
+    _TASKS_CACHE = (_stat_key(TASKS_FILE), {t["id"]: t for t in tasks}, len(tasks))
+
+
+def _tasks_by_id() -> Dict[str, Dict]:
+    """Fold tasks.jsonl (full records and later partial updates) into the latest state per id."""
+    global _TASKS_CACHE
+    if not TASKS_FILE.exists():
+        if LEGACY_TASKS_FILE.exists():
+            _write_tasks(_loads(LEGACY_TASKS_FILE.read_bytes()))
+            return _TASKS_CACHE[1]
+        _TASKS_CACHE = None
+        return {}
+
+    key = _stat_key(TASKS_FILE)
+    if _TASKS_CACHE and _TASKS_CACHE[0] == key:
+        return _TASKS_CACHE[1]
+
+    tasks: Dict[str, Dict] = {}
+    lines = 0
+    with open(TASKS_FILE, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = _loads(line)
+            tasks.setdefault(record["id"], {}).update(record)
+            lines += 1
+
+    if lines >= COMPACT_MIN_LINES and lines > COMPACT_RATIO * len(tasks):
+        _write_tasks(list(tasks.values()))
+    else:
+        _TASKS_CACHE = (key, tasks, lines)
+    return _TASKS_CACHE[1]
+
+
+def _load_tasks() -> List[Dict]:
+    return list(_tasks_by_id().values())
+
+
+def _index_tasks(tasks: List[Dict]) -> TaskIndex:
+    by_status: Dict[str, List[Dict]] = {}
+    by_project: Dict[str, List[Dict]] = {}
+    completed_by_day: Dict[str, List[Dict]] = {}
+    for t in tasks:
+        by_status.setdefault(t.get("status", "backlog"), []).append(t)
+        by_project.setdefault(t.get("project_id"), []).append(t)
+        day = (t.get("completed_at") or "")[:10]
+        if day:
+            completed_by_day.setdefault(day, []).append(t)
+    return TaskIndex(tasks, by_status, by_project, completed_by_day)
+
+
+def _task_index() -> TaskIndex:
+    """Index of the current tasks, shared by every report in this process."""
+    global _INDEX_CACHE
+    tasks = _load_tasks()
+    key = _TASKS_CACHE[0] if _TASKS_CACHE else None
+    if _INDEX_CACHE is None or _INDEX_CACHE[0] != key:
+        _INDEX_CACHE = (key, _index_tasks(tasks))
+    return _INDEX_CACHE[1]
+
+
+def _append_task(record: Dict):
+    """Append a full task or a partial {id, ...} update to tasks.jsonl."""
+    global _TASKS_CACHE
+    tasks = _tasks_by_id()
+    lines = _TASKS_CACHE[2] if _TASKS_CACHE else 0
+    _ensure_dirs()
+    with open(TASKS_FILE, "a", encoding="utf-8") as f:
+        f.write(_dumps(record, indent=False) + "\n")
+    if record["id"] not in tasks:
+        tasks[record["id"]] = record
+    _TASKS_CACHE = (_stat_key(TASKS_FILE), tasks, lines + 1)
 
 
 def _gen_id() -> str:
-    return str(uuid.uuid4())[:8]
+    return os.urandom(4).hex()
 
 
 # ─── Projects ────────────────────────────────────────────────────────────────
@@ -75,13 +200,22 @@ def create_project(name: str, description: str = "") -> Dict:
 
 def list_projects() -> List[Dict]:
     projects = _load(PROJECTS_FILE)
-    tasks = _load(TASKS_FILE)
+    totals = Counter()
+    dones = Counter()
+    for t in _load_tasks():
+        pid = t.get("project_id")
+        totals[pid] += 1
+        dones[pid] += t.get("status") == "done"
+
+    result = []
     for p in projects:
-        project_tasks = [t for t in tasks if t.get("project_id") == p["id"]]
-        p["task_count"] = len(project_tasks)
-        p["done_count"] = sum(1 for t in project_tasks if t.get("status") == "done")
+        pid = p["id"]
+        p = dict(p)  # keep derived counts out of the cached records
+        p["task_count"] = totals[pid]
+        p["done_count"] = dones[pid]
         p["progress"] = round(p["done_count"] / p["task_count"] * 100) if p["task_count"] > 0 else 0
-    return projects
+        result.append(p)
+    return result
 
 
 def add_milestone(project_id: str, title: str, due: str) -> Optional[Dict]:
@@ -98,7 +232,6 @@ def add_milestone(project_id: str, title: str, due: str) -> Optional[Dict]:
 # ─── Tasks ───────────────────────────────────────────────────────────────────
 
 def add_task(project_id: str, title: str, priority: str = "medium", assignee: str = "") -> Dict:
-    tasks = _load(TASKS_FILE)
     task = {
         "id": _gen_id(),
         "project_id": project_id,
@@ -109,38 +242,34 @@ def add_task(project_id: str, title: str, priority: str = "medium", assignee: st
         "created_at": datetime.now().isoformat(),
         "updated_at": datetime.now().isoformat(),
     }
-    tasks.append(task)
-    _save(TASKS_FILE, tasks)
+    _append_task(task)
     return task
 
 
 def update_task_status(task_id: str, status: str) -> Optional[Dict]:
-    tasks = _load(TASKS_FILE)
-    for t in tasks:
-        if t["id"] == task_id:
-            t["status"] = status
-            t["updated_at"] = datetime.now().isoformat()
-            if status == "done":
-                t["completed_at"] = datetime.now().isoformat()
-            _save(TASKS_FILE, tasks)
-            return t
-    return None
+    t = _tasks_by_id().get(task_id)
+    if t is None:
+        return None
+    delta = {"id": task_id, "status": status, "updated_at": datetime.now().isoformat()}
+    if status == "done":
+        delta["completed_at"] = datetime.now().isoformat()
+    t.update(delta)
+    _append_task(delta)
+    return t
 
 
 def assign_task(task_id: str, assignee: str) -> Optional[Dict]:
-    tasks = _load(TASKS_FILE)
-    for t in tasks:
-        if t["id"] == task_id:
-            t["assignee"] = assignee
-            t["updated_at"] = datetime.now().isoformat()
-            _save(TASKS_FILE, tasks)
-            return t
-    return None
+    t = _tasks_by_id().get(task_id)
+    if t is None:
+        return None
+    delta = {"id": task_id, "assignee": assignee, "updated_at": datetime.now().isoformat()}
+    t.update(delta)
+    _append_task(delta)
+    return t
 
 
 def list_tasks(project_id: str) -> List[Dict]:
-    tasks = _load(TASKS_FILE)
-    return [t for t in tasks if t.get("project_id") == project_id]
+    return list(_task_index().by_project.get(project_id, []))
 
 
 # ─── Sprints ─────────────────────────────────────────────────────────────────
@@ -166,85 +295,66 @@ def create_sprint(project_id: str, name: str, days: int = 7) -> Dict:
 # ─── Reports ─────────────────────────────────────────────────────────────────
 
 def standup() -> Dict:
-    tasks = _load(TASKS_FILE)
+    index = _task_index()
     today = date.today().isoformat()
     yesterday = (date.today() - timedelta(days=1)).isoformat()
 
-    done_yesterday = [t for t in tasks if t.get("completed_at", "")[:10] == yesterday]
-    in_progress = [t for t in tasks if t.get("status") == "in_progress"]
-    blocked = [t for t in tasks if t.get("status") == "review"]
+    done_yesterday = index.completed_by_day.get(yesterday, [])
+    in_progress = index.by_status.get("in_progress", [])
+    blocked = index.by_status.get("review", [])
 
     return {
         "date": today,
         "done_yesterday": [{"title": t["title"], "assignee": t.get("assignee", "")} for t in done_yesterday],
         "in_progress_today": [{"title": t["title"], "assignee": t.get("assignee", "")} for t in in_progress],
         "in_review": [{"title": t["title"], "assignee": t.get("assignee", "")} for t in blocked],
-        "total_backlog": sum(1 for t in tasks if t.get("status") == "backlog"),
+        "total_backlog": len(index.by_status.get("backlog", [])),
     }
 
 
 def project_report(project_id: str) -> Dict:
     projects = _load(PROJECTS_FILE)
-    tasks = _load(TASKS_FILE)
 
     project = next((p for p in projects if p["id"] == project_id), None)
     if not project:
         return {"error": "Project not found"}
 
-    project_tasks = [t for t in tasks if t.get("project_id") == project_id]
-    by_status = {}
-    for t in project_tasks:
-        s = t.get("status", "backlog")
-        by_status.setdefault(s, []).append(t["title"])
+    project_tasks = _task_index().by_project.get(project_id, [])
+    by_status = _count_by(project_tasks, "status", "backlog")
 
     return {
         "project": project["name"],
         "total_tasks": len(project_tasks),
-        "by_status": {s: len(items) for s, items in by_status.items()},
-        "progress": round(len(by_status.get("done", [])) / len(project_tasks) * 100) if project_tasks else 0,
+        "by_status": by_status,
+        "progress": round(by_status.get("done", 0) / len(project_tasks) * 100) if project_tasks else 0,
         "milestones": project.get("milestones", []),
         "by_assignee": _count_by(project_tasks, "assignee"),
     }
 
 
-def _count_by(items: list, key: str) -> Dict:
+def _count_by(items: list, key: str, default: str = "unassigned") -> Dict:
     counts = {}
     for item in items:
-        val = item.get(key, "unassigned") or "unassigned"
+        val = item.get(key, default) or default
         counts[val] = counts.get(val, 0) + 1
     return counts
 
 
 def dashboard() -> Dict:
     projects = list_projects()
-    tasks = _load(TASKS_FILE)
+    index = _task_index()
     return {
         "active_projects": len([p for p in projects if p.get("status") == "active"]),
-        "total_tasks": len(tasks),
-        "tasks_in_progress": sum(1 for t in tasks if t.get("status") == "in_progress"),
-        "tasks_done_today": sum(1 for t in tasks if t.get("completed_at", "")[:10] == date.today().isoformat()),
+        "total_tasks": len(index.tasks),
+        "tasks_in_progress": len(index.by_status.get("in_progress", [])),
+        "tasks_done_today": len(index.completed_by_day.get(date.today().isoformat(), [])),
         "projects": [{"id": p["id"], "name": p["name"], "progress": p.get("progress", 0)} for p in projects[:10]],
     }
 
 
 # ─── CLI ─────────────────────────────────────────────────────────────────────
 
-def main():
-    parser = argparse.ArgumentParser(description="Project Manager")
-    subparsers = parser.add_subparsers(dest="command")
-
-    subparsers.add_parser("dashboard")
-
-    sp = subparsers.add_parser("create")
-    sp.add_argument("name")
-    sp.add_argument("--description", default="")
-
-    subparsers.add_parser("list")
-
-    sp = subparsers.add_parser("view")
-    sp.add_argument("id")
-
-    # Task subcommands
+def _build_task_parser(subparsers):
     task_parser = subparsers.add_parser("task")
     task_sub = task_parser.add_subparsers(dest="task_action")
 
@@ -265,7 +375,8 @@ def main():
     sp.add_argument("task_id")
     sp.add_argument("--to", required=True, dest="assignee")
 
-    # Sprint subcommands
+
+def _build_sprint_parser(subparsers):
     sprint_parser = subparsers.add_parser("sprint")
     sprint_sub = sprint_parser.add_subparsers(dest="sprint_action")
 
@@ -274,16 +385,53 @@ def main():
     sp.add_argument("--name", required=True)
     sp.add_argument("--days", type=int, default=7)
 
-    subparsers.add_parser("standup")
 
-    sp = subparsers.add_parser("report")
-    sp.add_argument("project_id")
+def _build_create_parser(subparsers):
+    sp = subparsers.add_parser("create")
+    sp.add_argument("name")
+    sp.add_argument("--description", default="")
 
+
+def _build_id_parser(name: str):
+    def build(subparsers):
+        sp = subparsers.add_parser(name)
+        sp.add_argument("id" if name == "view" else "project_id")
+    return build
+
+
+def _build_milestone_parser(subparsers):
     sp = subparsers.add_parser("milestone")
     sp.add_argument("project_id")
     sp.add_argument("title")
     sp.add_argument("--due", required=True)
 
+
+# Subcommand parsers are built on demand so a call only pays for its own command
+_PARSER_BUILDERS = {
+    "dashboard": lambda subparsers: subparsers.add_parser("dashboard"),
+    "create": _build_create_parser,
+    "list": lambda subparsers: subparsers.add_parser("list"),
+    "view": _build_id_parser("view"),
+    "task": _build_task_parser,
+    "sprint": _build_sprint_parser,
+    "standup": lambda subparsers: subparsers.add_parser("standup"),
+    "report": _build_id_parser("report"),
+    "milestone": _build_milestone_parser,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Project Manager")
+    subparsers = parser.add_subparsers(dest="command")
+
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+    if command in _PARSER_BUILDERS:
+        _PARSER_BUILDERS[command](subparsers)
+    else:
+        # No, unknown or help command: build everything so usage lists all choices
+        for build in _PARSER_BUILDERS.values():
+            build(subparsers)
+
     args = parser.parse_args()
 
     if not args.command:
@@ -320,7 +468,7 @@ def main():
         result = add_milestone(args.project_id, args.title, args.due)
 
     if result is not None:
-        print(json.dumps(result, indent=2, default=str))
+        print(_dumps(result))
 
 
 if __name__ == "__main__":
@@ -4,6 +4,7 @@ QA Checker — Compliance, quality scoring, brand voice, and spam detection.
 
 Usage:
   python qa_checker.py review "message text"
+  python qa_checker.py review-batch --in messages.jsonl [--out results.jsonl]
   python qa_checker.py spam-score "subject" "body"
   python qa_checker.py compliance --type canspam --message "text"
   python qa_checker.py brand-voice "text to check"
@@ -11,31 +12,88 @@ Usage:
   python qa_checker.py report
   python qa_checker.py blocklist [--add "word"] [--remove "word"]
 
-Data: output/qa/
+Data: output/qa/ (reviews are appended to reviews.jsonl)
 """
 
-import argparse
+import hashlib
 import json
+import os
 import re
 import sys
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+
+    def _dumps(obj, indent: bool = True) -> str:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option, default=str).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj, indent: bool = True) -> str:
+        return json.dumps(obj, indent=2 if indent else None, default=str)
+
+    _loads = json.loads
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
 
 DATA_DIR = Path("output/qa")
-REVIEWS_FILE = DATA_DIR / "reviews.json"
+REVIEWS_FILE = DATA_DIR / "reviews.jsonl"
+LEGACY_REVIEWS_FILE = DATA_DIR / "reviews.json"
 BLOCKLIST_FILE = DATA_DIR / "blocklist.json"
 BRAND_VOICE_FILE = Path("output/brand_voice.json")
 
-# Spam trigger words (common email spam indicators)
-SPAM_TRIGGERS = [
+# Spam trigger words (common email spam indicators), deduplicated and ordered
+# longest first (then alphabetically) so the most specific phrases are reported first
+SPAM_TRIGGERS = tuple(sorted({
     "act now", "buy now", "click here", "congratulations", "dear friend",
     "double your", "earn money", "free", "guaranteed", "incredible deal",
     "limited time", "make money", "no obligation", "offer expires",
     "order now", "risk free", "special promotion", "urgent", "winner",
     "100% free", "cash bonus", "credit card", "discount", "lowest price",
     "million dollars", "no cost", "prize", "save big", "while supplies last",
-]
+}, key=lambda w: (-len(w), w)))
+
+_RE_FAKE_REPLY = re.compile(r'RE:|FW:')
+_RE_URL = re.compile(r'https?://\S+')
+# Street suffix must be a whole word ("12 main stuff" is not an address); common short forms first
+_ADDRESS_PATTERN = r'\b\d+\s+\w+\s+(?:st|rd|ave|dr|ln|way|ste|street|avenue|road|drive|lane|suite|blvd|boulevard)\b'
+_RE_ADDRESS = re.compile(_ADDRESS_PATTERN, re.I)
+# Compliance keyword sets as single alternations, matched against lower-cased text
+_RE_UNSUB = re.compile(r'unsubscribe|opt[- ]out|remove me')
+_RE_GDPR_DATA = re.compile(r'data|privacy|consent|legitimate interest')
+_RE_GDPR_ERASE = re.compile(r'unsubscribe|opt out|remove|delete my data')
+_RE_EMOJI = re.compile(r'[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF\U0001F1E0-\U0001F1FF]')
+
+# Presence-only patterns for the optional Hyperscan path (ids index _HS_NAMES)
+_HS_NAMES = ("address", "emoji")
+_HS_EXPRESSIONS = (
+    _ADDRESS_PATTERN.encode(),
+    rb'[\x{1F600}-\x{1F64F}\x{1F300}-\x{1F5FF}\x{1F680}-\x{1F6FF}\x{1F1E0}-\x{1F1FF}]',
+)
+
+_ASCII_UPPER = bytes(range(ord("A"), ord("Z") + 1))
+
+# Call-to-action indicators: single words match whole tokens ("try" is not in "country"),
+# multi-word phrases match as substrings
+CTA_WORDS = frozenset({"reply", "click", "visit", "schedule", "book", "call", "try", "start"})
+CTA_PHRASES = ("sign up",)
+_TOKEN_PUNCT = ".,!?;:"
 
 # CAN-SPAM required elements
 CANSPAM_CHECKS = [
@@ -53,57 +111,194 @@ DEFAULT_BRAND_VOICE = {
 }
 
 
+# Parsed rules files, keyed by path and validated by (mtime_ns, size)
+_CACHE: Dict[Path, Tuple[Tuple[int, int], object]] = {}
+
+# Reports over archives at least this large are split across processes
+PARALLEL_REPORT_MIN_BYTES = 4 * 1024 * 1024
+
+# Scored reviews by (message blake2b digest, blocklist stat key), least recently used first
+REVIEW_CACHE_SIZE = 2048
+_REVIEW_CACHE: "OrderedDict[Tuple[bytes, Optional[Tuple[int, int]]], Dict]" = OrderedDict()
+
+
 def _ensure_dirs():
     DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def _stat_key(filepath: Path) -> Tuple[int, int]:
+    st = filepath.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def _load_cached(filepath: Path, default):
+    """Parse a rules file, reusing the previous result until it changes on disk."""
+    try:
+        key = _stat_key(filepath)
+    except OSError:
+        _CACHE.pop(filepath, None)
+        return default
+    cached = _CACHE.get(filepath)
+    if cached and cached[0] == key:
+        return cached[1]
+    data = _loads(filepath.read_bytes())
+    _CACHE[filepath] = (key, data)
+    return data
+
+
 def _load_brand_voice() -> Dict:
-    if BRAND_VOICE_FILE.exists():
-        return json.loads(BRAND_VOICE_FILE.read_text())
-    return DEFAULT_BRAND_VOICE
+    return _load_cached(BRAND_VOICE_FILE, DEFAULT_BRAND_VOICE)
 
 
 def _load_blocklist() -> List[str]:
-    if BLOCKLIST_FILE.exists():
-        return json.loads(BLOCKLIST_FILE.read_text())
-    return []
+    return _load_cached(BLOCKLIST_FILE, [])
+
+
+@lru_cache(maxsize=32)
+def _matcher(words: tuple) -> Callable[[str], List[str]]:
+    """Build a matcher returning the words (in their given order) found in lower-cased text.
+
+    Uses a single Aho-Corasick pass when pyahocorasick is installed, otherwise
+    one substring test per word.
+    """
+    pairs = [(w, w.lower()) for w in words]
+    if not AHOCORASICK_AVAILABLE or not pairs:
+        return lambda text_lower: [w for w, lw in pairs if lw in text_lower]
+
+    automaton = ahocorasick.Automaton()
+    for _, lw in pairs:
+        automaton.add_word(lw, lw)
+    automaton.make_automaton()
+
+    def match(text_lower: str) -> List[str]:
+        found = {lw for _, lw in automaton.iter(text_lower)}
+        return [w for w, lw in pairs if lw in found] if found else []
+    return match
+
+
+@lru_cache(maxsize=1)
+def _hs_database():
+    """Compile the Hyperscan database on first use."""
+    db = hyperscan.Database()
+    flags = hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP | hyperscan.HS_FLAG_SINGLEMATCH
+    db.compile(
+        expressions=list(_HS_EXPRESSIONS),
+        ids=list(range(len(_HS_EXPRESSIONS))),
+        elements=len(_HS_EXPRESSIONS),
+        flags=[flags | hyperscan.HS_FLAG_CASELESS, flags],
+    )
+    return db
+
+
+@lru_cache(maxsize=64)
+def _hs_hits(text: str) -> frozenset:
+    """Names of the _HS_NAMES patterns present in text, found in one scan.
+
+    Cached per message so compliance and brand-voice checks share the pass.
+    """
+    hits = set()
+
+    def on_match(pattern_id, start, end, flags, context):
+        hits.add(_HS_NAMES[pattern_id])
+        return len(hits) == len(_HS_NAMES)  # stop once everything is found
+
+    _hs_database().scan(text.encode("utf-8"), match_event_handler=on_match)
+    return frozenset(hits)
+
+
+def _pattern_present(name: str, text: str, text_lower: Optional[str] = None) -> bool:
+    """Whether the address or emoji pattern occurs in text.
+
+    Uses the shared Hyperscan pass when available; otherwise the compiled
+    regex (the address regex runs over the lower-cased text).
+    """
+    if HYPERSCAN_AVAILABLE:
+        try:
+            return name in _hs_hits(text)
+        except (UnicodeEncodeError, hyperscan.error):
+            pass
+    if name == "address":
+        return bool(_RE_ADDRESS.search(text_lower if text_lower is not None else text.lower()))
+    return bool(_RE_EMOJI.search(text))
+
+
+@lru_cache(maxsize=64)
+def _prep(text: str) -> Tuple[str, str, Tuple[str, ...]]:
+    """(text, lower-cased text, words), computed once per distinct message.
+
+    review_message, check_compliance and check_brand_voice run on the same
+    message in a pipeline; the cache lets them share one lower() and split().
+    """
+    return text, text.lower(), tuple(text.split())
+
+
+def _count_caps_words(words: Tuple[str, ...]) -> int:
+    """Number of ALL CAPS words longer than two characters (counted, not collected).
+
+    A lowercase first character already rules a word out, which rejects most
+    prose words without the full isupper() scan.
+    """
+    return sum(1 for w in words if len(w) > 2 and not w[0].islower() and w.isupper())
+
+
+def _migrate_reviews():
+    """Convert a legacy reviews.json array into reviews.jsonl (once)."""
+    if REVIEWS_FILE.exists() or not LEGACY_REVIEWS_FILE.exists():
+        return
+    # Parse before touching reviews.jsonl, and publish it atomically, so a corrupt
+    # reviews.json leaves nothing behind and the migration is retried next time
+    reviews = _loads(LEGACY_REVIEWS_FILE.read_bytes())
+    tmp = REVIEWS_FILE.with_suffix(".jsonl.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        for review in reviews:
+            f.write(_dumps(review, indent=False) + "\n")
+    os.replace(tmp, REVIEWS_FILE)
 
 
 def _save_review(review: Dict):
     _ensure_dirs()
-    reviews = []
-    if REVIEWS_FILE.exists():
-        reviews = json.loads(REVIEWS_FILE.read_text())
-    reviews.append(review)
-    REVIEWS_FILE.write_text(json.dumps(reviews, indent=2))
+    _migrate_reviews()
+    with REVIEWS_FILE.open("a", encoding="utf-8") as f:
+        f.write(_dumps(review, indent=False) + "\n")
+
+
+def iter_reviews():
+    """Yield saved reviews oldest-first, one line at a time."""
+    _migrate_reviews()
+    if not REVIEWS_FILE.exists():
+        return
+    with REVIEWS_FILE.open(encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield _loads(line)
 
 
 # ─── Quality Scoring ─────────────────────────────────────────────────────────
 
-def review_message(message: str) -> Dict:
-    """Full quality review of a message."""
+def _score_message(message: str) -> Dict:
+    """Quality checks for a message (everything in a review except the timestamp)."""
     score = 100
     issues = []
     warnings = []
 
-    text_lower = message.lower()
+    _, text_lower, words = _prep(message)
     blocklist = _load_blocklist()
 
     # Spam trigger check (-5 per trigger, max -30)
-    spam_found = [w for w in SPAM_TRIGGERS if w in text_lower]
+    spam_found = _matcher(SPAM_TRIGGERS)(text_lower)
     penalty = min(len(spam_found) * 5, 30)
     score -= penalty
     if spam_found:
         issues.append(f"Spam triggers found: {', '.join(spam_found[:5])}")
 
     # Blocklist check (-10 per word)
-    blocked_found = [w for w in blocklist if w.lower() in text_lower]
+    blocked_found = _matcher(tuple(blocklist))(text_lower)
     score -= len(blocked_found) * 10
     if blocked_found:
         issues.append(f"Blocked words found: {', '.join(blocked_found)}")
 
     # Length check
-    word_count = len(message.split())
+    word_count = len(words)
     if word_count < 20:
         warnings.append("Message is very short (under 20 words)")
         score -= 5
@@ -112,10 +307,10 @@ def review_message(message: str) -> Dict:
         score -= 5
 
     # ALL CAPS check
-    caps_words = [w for w in message.split() if w.isupper() and len(w) > 2]
-    if len(caps_words) > 3:
+    caps_count = _count_caps_words(words)
+    if caps_count > 3:
         score -= 10
-        issues.append(f"Excessive ALL CAPS words: {len(caps_words)}")
+        issues.append(f"Excessive ALL CAPS words: {caps_count}")
 
     # Exclamation marks
     excl_count = message.count('!')
@@ -130,8 +325,8 @@ def review_message(message: str) -> Dict:
         warnings.append("No personalization detected (no name/variable references)")
 
     # CTA check
-    cta_words = ["reply", "click", "visit", "schedule", "book", "call", "sign up", "try", "start"]
-    has_cta = any(w in text_lower for w in cta_words)
+    has_cta = (not CTA_WORDS.isdisjoint(w.strip(_TOKEN_PUNCT).lower() for w in words)
+               or any(p in text_lower for p in CTA_PHRASES))
     if not has_cta:
         score -= 5
         warnings.append("No clear call-to-action detected")
@@ -140,7 +335,7 @@ def review_message(message: str) -> Dict:
 
     rating = "excellent" if score >= 90 else "good" if score >= 70 else "fair" if score >= 50 else "poor"
 
-    review = {
+    return {
         "score": score,
         "rating": rating,
         "issues": issues,
@@ -149,15 +344,96 @@ def review_message(message: str) -> Dict:
         "word_count": word_count,
         "has_personalization": has_personalization,
         "has_cta": has_cta,
-        "reviewed_at": datetime.now().isoformat(),
     }
 
-    _save_review(review)
+
+def _review_key(message: str) -> Tuple[bytes, Optional[Tuple[int, int]]]:
+    """Content hash of the message plus the blocklist version it was scored against."""
+    try:
+        rules = _stat_key(BLOCKLIST_FILE)
+    except OSError:
+        rules = None
+    digest = hashlib.blake2b(message.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    return digest, rules
+
+
+def review_message(message: str, now: Optional[str] = None, save: bool = True, use_cache: bool = True) -> Dict:
+    """Full quality review of a message.
+
+    Batch callers can pass one precomputed ISO timestamp as `now`, and
+    save=False when they write the review log themselves. Identical messages
+    reuse the cached scoring until the blocklist changes (use_cache=False to skip).
+    """
+    key = _review_key(message) if use_cache else None
+    scored = _REVIEW_CACHE.get(key) if key else None
+    if scored is None:
+        scored = _score_message(message)
+        if key:
+            _REVIEW_CACHE[key] = scored
+            if len(_REVIEW_CACHE) > REVIEW_CACHE_SIZE:
+                _REVIEW_CACHE.popitem(last=False)
+    else:
+        _REVIEW_CACHE.move_to_end(key)
+
+    review = {k: list(v) if isinstance(v, list) else v for k, v in scored.items()}
+    review["reviewed_at"] = now or datetime.now().isoformat()
+
+    if save:
+        _save_review(review)
     return review
 
 
+def review_batch(in_path: str, out_path: str = None, use_cache: bool = True) -> Dict:
+    """Review every message in a JSON Lines file within one process.
+
+    Each input line is a JSON string or an object with a "message" field (an
+    "id" field is carried into the result). Reviews are written one per line
+    to out_path and appended to the review log.
+    """
+    now = datetime.now().isoformat()
+    if not out_path:
+        out_path = str(DATA_DIR / f"review_batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl")
+    Path(out_path).parent.mkdir(parents=True, exist_ok=True)
+    _ensure_dirs()
+    _migrate_reviews()
+
+    reviewed = 0
+    score_sum = 0
+    with open(in_path, encoding="utf-8") as src, open(out_path, "w", encoding="utf-8") as out, \
+            REVIEWS_FILE.open("a", encoding="utf-8") as log:
+        for line in src:
+            if not line.strip():
+                continue
+            item = _loads(line)
+            if isinstance(item, dict):
+                review = review_message(item.get("message", ""), now=now, save=False, use_cache=use_cache)
+                if "id" in item:
+                    review = {"id": item["id"], **review}
+            else:
+                review = review_message(str(item), now=now, save=False, use_cache=use_cache)
+            record = _dumps(review, indent=False) + "\n"
+            out.write(record)
+            log.write(record)
+            reviewed += 1
+            score_sum += review["score"]
+
+    return {
+        "reviewed": reviewed,
+        "avg_score": round(score_sum / reviewed) if reviewed else 0,
+        "output": out_path,
+    }
+
+
 # ─── Spam Score ──────────────────────────────────────────────────────────────
 
+def _count_upper(text: str) -> int:
+    """Number of uppercase characters; ASCII text is counted with a C-level byte delete."""
+    if text.isascii():
+        raw = text.encode("ascii")
+        return len(raw) - len(raw.translate(None, _ASCII_UPPER))
+    return sum(1 for c in text if c.isupper())
+
+
 def spam_score(subject: str, body: str) -> Dict:
     """Calculate spam score for an email."""
     score = 0  # 0 = clean, 100 = definitely spam
@@ -172,24 +448,24 @@ def spam_score(subject: str, body: str) -> Dict:
     if subject.count('!') > 1:
         score += 10
         flags.append("Multiple exclamation marks in subject")
-    if re.search(r'RE:|FW:', subject) and "reply" not in combined:
+    if _RE_FAKE_REPLY.search(subject) and "reply" not in combined:
         score += 15
         flags.append("Fake RE:/FW: prefix")
 
     # Trigger words
-    triggers = [w for w in SPAM_TRIGGERS if w in combined]
+    triggers = _matcher(SPAM_TRIGGERS)(combined)
     score += min(len(triggers) * 5, 40)
     if triggers:
         flags.append(f"Spam words: {', '.join(triggers[:5])}")
 
     # ALL CAPS in body
-    caps_ratio = sum(1 for c in body if c.isupper()) / max(len(body), 1)
+    caps_ratio = _count_upper(body) / max(len(body), 1)
     if caps_ratio > 0.3:
         score += 15
         flags.append("High CAPS ratio in body")
 
     # URL density
-    urls = re.findall(r'https?://\S+', body)
+    urls = _RE_URL.findall(body)
     if len(urls) > 3:
         score += 10
         flags.append(f"Too many URLs: {len(urls)}")
@@ -202,22 +478,21 @@ def spam_score(subject: str, body: str) -> Dict:
 
 # ─── Compliance ──────────────────────────────────────────────────────────────
 
-def check_compliance(message: str, compliance_type: str = "canspam") -> Dict:
-    """Check message for legal compliance."""
-    text_lower = message.lower()
+def check_compliance(message: str, compliance_type: str = "canspam", now: Optional[str] = None) -> Dict:
+    """Check message for legal compliance (`now`: optional precomputed ISO timestamp)."""
+    _, text_lower, _ = _prep(message)
     passed = []
     failed = []
 
     if compliance_type == "canspam":
         # Unsubscribe
-        if any(w in text_lower for w in ["unsubscribe", "opt out", "opt-out", "remove me"]):
+        if _RE_UNSUB.search(text_lower):
             passed.append("Unsubscribe mechanism present")
         else:
             failed.append("Missing unsubscribe mechanism (CAN-SPAM required)")
 
         # Physical address
-        address_pattern = r'\d+\s+\w+\s+(street|st|avenue|ave|road|rd|boulevard|blvd|drive|dr|lane|ln|way|suite|ste)'
-        if re.search(address_pattern, text_lower):
+        if _pattern_present("address", message, text_lower):
             passed.append("Physical address present")
         else:
             failed.append("Missing physical mailing address (CAN-SPAM required)")
@@ -227,12 +502,12 @@ def check_compliance(message: str, compliance_type: str = "canspam") -> Dict:
             failed.append("Message too short to contain required elements")
 
     elif compliance_type == "gdpr":
-        if any(w in text_lower for w in ["data", "privacy", "consent", "legitimate interest"]):
+        if _RE_GDPR_DATA.search(text_lower):
             passed.append("Data processing reference found")
         else:
             failed.append("No data processing disclosure (GDPR recommended)")
 
-        if any(w in text_lower for w in ["unsubscribe", "opt out", "remove", "delete my data"]):
+        if _RE_GDPR_ERASE.search(text_lower):
             passed.append("Right to erasure/opt-out mentioned")
         else:
             failed.append("No right to erasure mention (GDPR recommended)")
@@ -244,7 +519,7 @@ def check_compliance(message: str, compliance_type: str = "canspam") -> Dict:
         "type": compliance_type,
         "passed": passed,
         "failed": failed,
-        "checked_at": datetime.now().isoformat(),
+        "checked_at": now or datetime.now().isoformat(),
     }
 
 
@@ -253,30 +528,30 @@ def check_compliance(message: str, compliance_type: str = "canspam") -> Dict:
 def check_brand_voice(text: str) -> Dict:
     """Check text against brand voice guidelines."""
     voice = _load_brand_voice()
-    text_lower = text.lower()
+    _, text_lower, words = _prep(text)
     issues = []
 
     # Avoided words
-    avoided_found = [w for w in voice.get("avoid", []) if w.lower() in text_lower]
+    avoided_found = _matcher(tuple(voice.get("avoid", [])))(text_lower)
     if avoided_found:
         issues.append(f"Avoided words used: {', '.join(avoided_found)}")
 
     # Exclamation marks
     max_excl = voice.get("max_exclamation_marks", 1)
-    if text.count('!') > max_excl:
-        issues.append(f"Too many exclamation marks ({text.count('!')} > {max_excl})")
+    excl_count = text.count('!')
+    if excl_count > max_excl:
+        issues.append(f"Too many exclamation marks ({excl_count} > {max_excl})")
 
     # Emoji check
     if not voice.get("emoji_allowed", False):
-        emoji_pattern = re.compile(r'[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF\U0001F1E0-\U0001F1FF]')
-        if emoji_pattern.search(text):
+        if _pattern_present("emoji", text):
             issues.append("Emojis used but not allowed by brand voice")
 
     # ALL CAPS
     max_caps = voice.get("max_caps_words", 2)
-    caps_words = [w for w in text.split() if w.isupper() and len(w) > 2]
-    if len(caps_words) > max_caps:
-        issues.append(f"Too many ALL CAPS words ({len(caps_words)} > {max_caps})")
+    caps_count = _count_caps_words(words)
+    if caps_count > max_caps:
+        issues.append(f"Too many ALL CAPS words ({caps_count} > {max_caps})")
 
     consistent = len(issues) == 0
 
@@ -291,25 +566,113 @@ def check_brand_voice(text: str) -> Dict:
 # ─── Blocklist ───────────────────────────────────────────────────────────────
 
 def manage_blocklist(add: str = None, remove: str = None) -> List[str]:
-    blocklist = _load_blocklist()
+    blocklist = list(_load_blocklist())
     if add:
         if add not in blocklist:
             blocklist.append(add)
     if remove:
         blocklist = [w for w in blocklist if w != remove]
     _ensure_dirs()
-    BLOCKLIST_FILE.write_text(json.dumps(blocklist, indent=2))
+    BLOCKLIST_FILE.write_text(_dumps(blocklist), encoding="utf-8")
+    _CACHE[BLOCKLIST_FILE] = (_stat_key(BLOCKLIST_FILE), blocklist)
     return blocklist
 
 
+# ─── Reports ─────────────────────────────────────────────────────────────────
+
+def _tally_reviews(reviews) -> List[int]:
+    """[total, scored, score_sum, excellent, good, fair, poor] in a single pass."""
+    total = scored = score_sum = excellent = good = fair = poor = 0
+    for r in reviews:
+        total += 1
+        s = r.get("score")
+        if s is None:
+            continue
+        scored += 1
+        score_sum += s
+        if s >= 90:
+            excellent += 1
+        elif s >= 70:
+            good += 1
+        elif s >= 50:
+            fair += 1
+        else:
+            poor += 1
+    return [total, scored, score_sum, excellent, good, fair, poor]
+
+
+def _tally_range(path: str, start: int, end: int) -> List[int]:
+    """_tally_reviews over the lines starting in [start, end) of a JSONL file."""
+    def lines():
+        with open(path, "rb") as f:
+            f.seek(start)
+            pos = start
+            while pos < end:
+                line = f.readline()
+                if not line:
+                    break
+                pos += len(line)
+                if line.strip():
+                    yield _loads(line)
+    return _tally_reviews(lines())
+
+
+def _line_ranges(path: Path, parts: int) -> List[Tuple[int, int]]:
+    """Split a file into up to `parts` byte ranges that start and end on line boundaries."""
+    size = path.stat().st_size
+    bounds = [0]
+    with open(path, "rb") as f:
+        for i in range(1, parts):
+            f.seek(max(size * i // parts, bounds[-1]))
+            f.readline()
+            bounds.append(min(f.tell(), size))
+    bounds.append(size)
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if b > a]
+
+
+def review_report() -> Dict:
+    """Score distribution across all saved reviews.
+
+    Archives of PARALLEL_REPORT_MIN_BYTES or more are tallied in line-aligned
+    chunks across worker processes.
+    """
+    _migrate_reviews()
+    if REVIEWS_FILE.exists() and REVIEWS_FILE.stat().st_size >= PARALLEL_REPORT_MIN_BYTES:
+        from concurrent.futures import ProcessPoolExecutor  # only needed for large archives
+
+        ranges = _line_ranges(REVIEWS_FILE, os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+            parts = pool.map(_tally_range, *zip(*((str(REVIEWS_FILE), a, b) for a, b in ranges)))
+            tally = [sum(col) for col in zip(*parts)]
+    else:
+        tally = _tally_reviews(iter_reviews())
+    total, scored, score_sum, excellent, good, fair, poor = tally
+    return {
+        "total_reviews": total,
+        "avg_score": round(score_sum / scored) if scored else 0,
+        "excellent": excellent,
+        "good": good,
+        "fair": fair,
+        "poor": poor,
+    }
+
+
 # ─── CLI ─────────────────────────────────────────────────────────────────────
 
 def main():
+    import argparse  # CLI only; keeps library imports (e.g. from integration_manager) light
+
     parser = argparse.ArgumentParser(description="QA Checker — Compliance & Quality")
     subparsers = parser.add_subparsers(dest="command")
 
     sp = subparsers.add_parser("review", help="Review message quality")
     sp.add_argument("message")
+    sp.add_argument("--no-cache", action="store_true", help="Always re-score, even for repeated content")
+
+    sp = subparsers.add_parser("review-batch", help="Review every message in a JSONL file")
+    sp.add_argument("--in", dest="in_path", required=True, help="JSONL of strings or {\"message\": ...} objects")
+    sp.add_argument("--out", dest="out_path", help="JSONL results file (default: output/qa/review_batch_<ts>.jsonl)")
+    sp.add_argument("--no-cache", action="store_true", help="Always re-score, even for repeated content")
 
     sp = subparsers.add_parser("spam-score", help="Check spam score")
     sp.add_argument("subject")
@@ -338,38 +701,30 @@ def main():
         sys.exit(0)
 
     if args.command == "review":
-        print(json.dumps(review_message(args.message), indent=2))
+        print(_dumps(review_message(args.message, use_cache=not args.no_cache)))
+    elif args.command == "review-batch":
+        print(_dumps(review_batch(args.in_path, args.out_path, not args.no_cache)))
     elif args.command == "spam-score":
-        print(json.dumps(spam_score(args.subject, args.body), indent=2))
+        print(_dumps(spam_score(args.subject, args.body)))
     elif args.command == "compliance":
-        print(json.dumps(check_compliance(args.message, args.type), indent=2))
+        print(_dumps(check_compliance(args.message, args.type)))
     elif args.command == "brand-voice":
-        print(json.dumps(check_brand_voice(args.text), indent=2))
+        print(_dumps(check_brand_voice(args.text)))
     elif args.command == "blocklist":
         result = manage_blocklist(args.add, args.remove)
-        print(json.dumps(result, indent=2))
+        print(_dumps(result))
     elif args.command == "audit":
-        if REVIEWS_FILE.exists():
-            reviews = json.loads(REVIEWS_FILE.read_text())
+        if REVIEWS_FILE.exists() or LEGACY_REVIEWS_FILE.exists():
             cutoff = (datetime.now() - timedelta(days=args.days)).isoformat()
-            recent = [r for r in reviews if r.get("reviewed_at", "") >= cutoff]
-            print(json.dumps({"period_days": args.days, "reviews": len(recent), "results": recent}, indent=2))
+            recent = [r for r in iter_reviews() if r.get("reviewed_at", "") >= cutoff]
+            print(_dumps({"period_days": args.days, "reviews": len(recent), "results": recent}))
         else:
-            print(json.dumps({"reviews": 0, "results": []}, indent=2))
+            print(_dumps({"reviews": 0, "results": []}))
     elif args.command == "report":
-        if REVIEWS_FILE.exists():
-            reviews = json.loads(REVIEWS_FILE.read_text())
-            scores = [r["score"] for r in reviews if "score" in r]
-            print(json.dumps({
-                "total_reviews": len(reviews),
-                "avg_score": round(sum(scores) / len(scores)) if scores else 0,
-                "excellent": sum(1 for s in scores if s >= 90),
-                "good": sum(1 for s in scores if 70 <= s < 90),
-                "fair": sum(1 for s in scores if 50 <= s < 70),
-                "poor": sum(1 for s in scores if s < 50),
-            }, indent=2))
+        if REVIEWS_FILE.exists() or LEGACY_REVIEWS_FILE.exists():
+            print(_dumps(review_report()))
         else:
-            print(json.dumps({"total_reviews": 0}, indent=2))
+            print(_dumps({"total_reviews": 0}))
 
 
 if __name__ == "__main__":